@@ -0,0 +1,49 @@
+"""Persist generated scene images behind the image cache.
+
+Revision ID: 1b2c3d4e5f6a
+Revises: 9a1b2c3d4e5f
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "1b2c3d4e5f6a"
+down_revision = "9a1b2c3d4e5f"
+branch_labels = None
+depends_on = None
+
+
+TABLE_NAME = "scene_images"
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def upgrade() -> None:
+    if _has_table(TABLE_NAME):
+        return
+    op.create_table(
+        TABLE_NAME,
+        sa.Column("cache_key", sa.String(length=32), nullable=False),
+        sa.Column("scene_id", sa.String(length=50), nullable=True),
+        sa.Column("style", sa.String(length=50), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("prompt", sa.Text(), nullable=False),
+        sa.Column("generated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+
+
+def downgrade() -> None:
+    if _offline_mode() or _has_table(TABLE_NAME):
+        op.drop_table(TABLE_NAME)
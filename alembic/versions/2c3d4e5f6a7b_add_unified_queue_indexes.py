@@ -0,0 +1,57 @@
+"""Add composite indexes for the unified review queue fetches.
+
+Revision ID: 2c3d4e5f6a7b
+Revises: 1b2c3d4e5f6a
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "2c3d4e5f6a7b"
+down_revision = "1b2c3d4e5f6a"
+branch_labels = None
+depends_on = None
+
+
+VOCAB_TABLE = "user_vocabulary_progress"
+VOCAB_INDEX = "ix_user_vocabulary_progress_user_due_at"
+ERROR_TABLE = "user_errors"
+ERROR_INDEX = "ix_user_errors_user_review_order"
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return True
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    if _offline_mode() or not _has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # Grammar and conjugation progress already carry (user_id, due column)
+    # indexes. Vocabulary is due by due_at first, and errors are read in
+    # lapses/occurrences order, which a plain (user_id) index cannot serve.
+    if _has_table(VOCAB_TABLE) and not _has_index(VOCAB_TABLE, VOCAB_INDEX):
+        op.create_index(VOCAB_INDEX, VOCAB_TABLE, ["user_id", "due_at"])
+    if _has_table(ERROR_TABLE) and not _has_index(ERROR_TABLE, ERROR_INDEX):
+        op.create_index(
+            ERROR_INDEX,
+            ERROR_TABLE,
+            ["user_id", sa.text("lapses DESC"), sa.text("occurrences DESC"), "next_review_date"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(ERROR_INDEX, table_name=ERROR_TABLE, if_exists=True)
+    op.drop_index(VOCAB_INDEX, table_name=VOCAB_TABLE, if_exists=True)
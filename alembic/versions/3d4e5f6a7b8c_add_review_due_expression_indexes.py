@@ -0,0 +1,58 @@
+"""Add expression indexes for the review queue due predicates.
+
+Revision ID: 3d4e5f6a7b8c
+Revises: 2c3d4e5f6a7b
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "3d4e5f6a7b8c"
+down_revision = "2c3d4e5f6a7b"
+branch_labels = None
+depends_on = None
+
+
+# Must match NEVER_REVIEWED in app.services.unified_srs for the planner to
+# use these indexes.
+NEVER_REVIEWED = "'1970-01-01 00:00:00+00'"
+INDEXES = {
+    "ix_user_grammar_progress_user_review_due": ("user_grammar_progress", "next_review"),
+    "ix_user_errors_user_review_due": ("user_errors", "next_review_date"),
+}
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return True
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    if _offline_mode() or not _has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # "next_review <= now OR next_review IS NULL" turns into two index scans
+    # OR'ed together; the queue now compares COALESCE(...) once instead.
+    for index_name, (table_name, column_name) in INDEXES.items():
+        if _has_table(table_name) and not _has_index(table_name, index_name):
+            op.create_index(
+                index_name,
+                table_name,
+                ["user_id", sa.text(f"COALESCE({column_name}, {NEVER_REVIEWED})")],
+            )
+
+
+def downgrade() -> None:
+    for index_name, (table_name, _) in INDEXES.items():
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
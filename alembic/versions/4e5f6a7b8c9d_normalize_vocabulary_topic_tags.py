@@ -0,0 +1,70 @@
+"""Store vocabulary topic tags stripped and lowercased.
+
+Revision ID: 4e5f6a7b8c9d
+Revises: 3d4e5f6a7b8c
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "4e5f6a7b8c9d"
+down_revision = "3d4e5f6a7b8c"
+branch_labels = None
+depends_on = None
+
+
+TABLE_NAME = "vocabulary_words"
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return True
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def upgrade() -> None:
+    if not _is_postgresql() or not _has_table(TABLE_NAME):
+        return
+
+    # Topic lookups compare tags with && on the GIN index, which is case- and
+    # whitespace-sensitive; new writes go through TopicTagList, this fixes the
+    # rows written before it.
+    op.execute(
+        sa.text(
+            """
+            UPDATE vocabulary_words
+            SET topic_tags = ARRAY(
+                SELECT normalized.tag
+                FROM (
+                    SELECT lower(btrim(tag)) AS tag, min(position) AS position
+                    FROM unnest(vocabulary_words.topic_tags) WITH ORDINALITY AS stored (tag, position)
+                    WHERE btrim(tag) <> ''
+                    GROUP BY lower(btrim(tag))
+                ) AS normalized
+                ORDER BY normalized.position
+            )
+            WHERE topic_tags IS NOT NULL
+              AND EXISTS (
+                  SELECT 1
+                  FROM unnest(vocabulary_words.topic_tags) AS stored (tag)
+                  WHERE tag IS DISTINCT FROM lower(btrim(tag))
+              )
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    # The original spelling of each tag is not kept, so there is nothing to restore.
+    pass
@@ -0,0 +1,53 @@
+"""Index chapters and scenes by their parent and order.
+
+Revision ID: 9a1b2c3d4e5f
+Revises: c6d7e8f9a0b1
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "9a1b2c3d4e5f"
+down_revision = "c6d7e8f9a0b1"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = {
+    "ix_chapters_story_order": ("chapters", ["story_id", "order_index"]),
+    "ix_scenes_chapter_order": ("scenes", ["chapter_id", "order_index"]),
+}
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return True
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    if _offline_mode() or not _has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # "First scene of a chapter" and "next chapter by order" both filter on
+    # the parent and sort by order_index; one B-tree descent then serves
+    # the LIMIT 1 without a sort.
+    for index_name, (table_name, columns) in INDEXES.items():
+        if _has_table(table_name) and not _has_index(table_name, index_name):
+            op.create_index(index_name, table_name, columns)
+
+
+def downgrade() -> None:
+    for index_name, (table_name, _) in INDEXES.items():
+        if _offline_mode() or _has_index(table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,56 @@
+"""Add a GIN index on vocabulary topic tags.
+
+Revision ID: a3b4c5d6e7f8
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "a3b4c5d6e7f8"
+down_revision = "f7a8b9c0d1e2"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_vocabulary_words_topic_tags"
+TABLE_NAME = "vocabulary_words"
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    if _offline_mode() or not _has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # Topic-compatible vocabulary is filtered with the text[] overlap operator,
+    # which only PostgreSQL can serve from a GIN index.
+    if not _is_postgresql():
+        return
+    if _offline_mode() or (_has_table(TABLE_NAME) and not _has_index(TABLE_NAME, INDEX_NAME)):
+        op.create_index(INDEX_NAME, TABLE_NAME, ["topic_tags"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    if _offline_mode() or (_has_table(TABLE_NAME) and _has_index(TABLE_NAME, INDEX_NAME)):
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
@@ -0,0 +1,86 @@
+"""Store perfectly completed chapter ids on story progress.
+
+Revision ID: b5c6d7e8f9a0
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "b5c6d7e8f9a0"
+down_revision = "a3b4c5d6e7f8"
+branch_labels = None
+depends_on = None
+
+
+TABLE_NAME = "story_progress"
+COLUMN_NAME = "perfect_chapter_ids"
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return True
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    if _offline_mode() or not _has_table(table_name):
+        return False
+    return column_name in {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def upgrade() -> None:
+    if not _has_table(TABLE_NAME):
+        return
+    if not _has_column(TABLE_NAME, COLUMN_NAME):
+        op.add_column(
+            TABLE_NAME,
+            sa.Column(COLUMN_NAME, postgresql.JSONB().with_variant(sa.JSON(), "sqlite"), nullable=True),
+        )
+    if not _is_postgresql():
+        return
+
+    # Backfill from the completion log: perfect ids, plus any completed chapter
+    # that only the log recorded, so readers no longer have to scan it. The log
+    # column was added as plain json, hence the casts.
+    op.execute(
+        sa.text(
+            """
+            UPDATE story_progress
+            SET
+                perfect_chapter_ids = COALESCE((
+                    SELECT jsonb_agg(DISTINCT detail ->> 'chapter_id')
+                    FROM jsonb_array_elements(story_progress.chapters_completed_details::jsonb) AS detail
+                    WHERE (detail ->> 'was_perfect')::boolean
+                ), '[]'::jsonb),
+                chapters_completed = (
+                    SELECT jsonb_agg(DISTINCT chapter_id)
+                    FROM (
+                        SELECT jsonb_array_elements_text(COALESCE(story_progress.chapters_completed, '[]'::jsonb))
+                        UNION
+                        SELECT detail ->> 'chapter_id'
+                        FROM jsonb_array_elements(story_progress.chapters_completed_details::jsonb) AS detail
+                    ) AS completed (chapter_id)
+                )
+            WHERE jsonb_typeof(chapters_completed_details::jsonb) = 'array'
+              AND chapters_completed_details::jsonb <> '[]'::jsonb
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    if _offline_mode() or _has_column(TABLE_NAME, COLUMN_NAME):
+        op.drop_column(TABLE_NAME, COLUMN_NAME)
@@ -0,0 +1,59 @@
+"""Add a partial title index for the active story catalog.
+
+Revision ID: c6d7e8f9a0b1
+Revises: b5c6d7e8f9a0
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c6d7e8f9a0b1"
+down_revision = "b5c6d7e8f9a0"
+branch_labels = None
+depends_on = None
+
+
+TABLE_NAME = "stories"
+TITLE_INDEX = "ix_stories_active_title"
+
+
+def _offline_mode() -> bool:
+    return bool(getattr(op.get_context(), "as_sql", False))
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _has_table(table_name: str) -> bool:
+    if _offline_mode():
+        return True
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    if _offline_mode() or not _has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # The catalog only ever lists active stories, ordered by title
+    if not _is_postgresql() or not _has_table(TABLE_NAME):
+        return
+    if not _has_index(TABLE_NAME, TITLE_INDEX):
+        op.create_index(
+            TITLE_INDEX,
+            TABLE_NAME,
+            ["title"],
+            postgresql_where=sa.text("is_active"),
+        )
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    op.drop_index(TITLE_INDEX, table_name=TABLE_NAME, if_exists=True)
@@ -1,6 +1,7 @@
 """Endpoints for learner vocabulary progress."""
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -162,7 +163,7 @@ def get_unified_review_queue(
     queue = session.queue[:limit]
 
     return UnifiedQueueResponse(
-        summary=UnifiedQueueSummary(**session.summary.__dict__),
+        summary=UnifiedQueueSummary(**asdict(session.summary)),
         queue=[UnifiedQueueItem(**service.serialize_item(item)) for item in queue],
         interleaving_mode=session.interleaving_mode.value,
         time_budget_minutes=session.time_budget_minutes,
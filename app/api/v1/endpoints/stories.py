@@ -25,6 +25,7 @@ from app.db.models.library import UserBook
 from app.db.models.user import User
 from app.schemas.story import (
     ChapterRead,
+    ChapterWithStatusRead,
     ConsequenceRead,
     NPCInSceneRead,
     NPCResponseRead,
@@ -39,8 +40,10 @@ from app.schemas.story import (
 from app.services.book_library import SUPPORTED_LIBRARY_FORMATS, BookLibraryService
 from app.services.error_memory import ErrorMemoryService
 from app.services.npc_service import NPCService
-from app.services.story_service import StoryService
+from app.services.story_service import STORY_CACHE_TTL_SECONDS, StoryService, story_cache_key
+from app.tasks.achievements import check_user_achievements
 from app.tasks.book_library import process_user_book_upload, process_user_book_upload_inline
+from app.utils.cache import cache_backend
 
 router = APIRouter()
 
@@ -130,6 +133,20 @@ def _enqueue_library_processing(
     background_tasks.add_task(process_user_book_upload_inline, **task_kwargs)
 
 
+def _enqueue_achievement_check(user: User) -> None:
+    """Queue an achievement evaluation without holding up the response.
+
+    Without a Celery broker the check is skipped here; session completion and
+    the periodic ``check_all_achievements`` task still pick the user up.
+    """
+    if not (settings.CELERY_BROKER_URL or settings.CELERY_RESULT_BACKEND or settings.REDIS_URL):
+        return
+    try:
+        check_user_achievements.delay(str(user.id))
+    except Exception as exc:
+        logger.warning("Could not queue story achievement check", user_id=str(user.id), error=str(exc))
+
+
 @router.post("/upload-book")
 async def upload_book(
     *,
@@ -527,7 +544,7 @@ async def get_chapter_cover(
 # ============================================================================
 
 @router.get("", response_model=list[StoryWithProgressRead])
-async def list_stories(
+def list_stories(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
@@ -562,7 +579,7 @@ async def list_stories(
 
 
 @router.get("/{story_id}", response_model=StoryWithProgressRead)
-async def get_story(
+def get_story(
     story_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
@@ -602,7 +619,7 @@ async def get_story(
 
 
 @router.post("/{story_id}/start", response_model=StoryStartResponse)
-async def start_story(
+def start_story(
     story_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
@@ -700,7 +717,7 @@ async def start_story(
 
 
 @router.get("/{story_id}/scene", response_model=SceneRead | None)
-async def get_current_scene(
+def get_current_scene(
     story_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
@@ -754,7 +771,7 @@ async def get_current_scene(
 
 
 @router.get("/{story_id}/progress", response_model=StoryProgressRead | None)
-async def get_story_progress(
+def get_story_progress(
     story_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
@@ -766,12 +783,9 @@ async def get_story_progress(
     if not progress:
         return None
     
-    # Get chapter title if available
-    chapter_title = None
-    if progress.current_chapter_id:
-        from app.db.models.story import Chapter
-        chapter = db.get(Chapter, progress.current_chapter_id)
-        chapter_title = chapter.title if chapter else None
+    # Get chapter title if available; the progress query joined the chapter in
+    chapter = progress.current_chapter
+    chapter_title = chapter.title if chapter else None
     
     return StoryProgressRead(
         story_id=progress.story_id,
@@ -789,7 +803,7 @@ async def get_story_progress(
 
 
 @router.post("/{story_id}/input", response_model=StoryInputResponse)
-async def process_story_input(
+def process_story_input(
     story_id: str,
     request: StoryInputRequest,
     db: Annotated[Session, Depends(get_db)],
@@ -1183,20 +1197,30 @@ async def process_story_input(
 # Chapter-Level Endpoints (merged from worktree)
 # ============================================================================
 
-@router.get("/{story_id}/chapters", response_model=list["ChapterWithStatusRead"])
-async def get_story_chapters(
+@router.get("/{story_id}/chapters", response_model=list[ChapterWithStatusRead])
+def get_story_chapters(
     story_id: str,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Get all chapters for a story with completion status."""
-    from app.db.models.story import Chapter, Story
-    from app.schemas.story import ChapterWithStatusRead
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from app.db.models.story import Story
+
+    cache_key = story_cache_key(current_user.id, story_id)
+    cached = cache_backend.get("stories:chapters", cache_key)
+    if cached is not None:
+        return [ChapterWithStatusRead(**item) for item in cached]
 
     story_service = StoryService(db)
 
-    # Get story
-    story = db.get(Story, story_id)
+    # Get story; its chapters arrive in one extra IN query, already ordered by
+    # the relationship's order_by
+    story = db.execute(
+        select(Story).options(selectinload(Story.chapters)).where(Story.id == story_id)
+    ).scalar_one_or_none()
     if not story:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1206,28 +1230,18 @@ async def get_story_chapters(
     # Get user progress
     progress = story_service.get_story_progress(current_user, story_id)
 
-    # Get all chapters ordered
-    chapters = db.query(Chapter).filter(
-        Chapter.story_id == story_id
-    ).order_by(Chapter.order_index).all()
-
-    # Build completed/perfect chapter sets
-    completed_chapter_ids = set()
-    perfect_chapter_ids = set()
-
-    if progress and progress.chapters_completed_details:
-        for detail in progress.chapters_completed_details:
-            completed_chapter_ids.add(detail["chapter_id"])
-            if detail.get("was_perfect"):
-                perfect_chapter_ids.add(detail["chapter_id"])
-    elif progress and progress.chapters_completed:
-        completed_chapter_ids = set(progress.chapters_completed)
-
-    current_chapter_order = None
-    if progress and progress.current_chapter_id:
-        current_chapter = db.get(Chapter, progress.current_chapter_id)
-        if current_chapter:
-            current_chapter_order = current_chapter.order_index
+    chapters = story.chapters
+
+    # Completed/perfect chapter ids are stored on the progress row itself
+    completed_chapter_ids = frozenset(progress.chapters_completed or []) if progress else frozenset()
+    perfect_chapter_ids = frozenset(progress.perfect_chapter_ids or []) if progress else frozenset()
+
+    # The current chapter is one of the chapters already loaded with the story
+    current_chapter_id = progress.current_chapter_id if progress else None
+    current_chapter_order = next(
+        (chapter.order_index for chapter in chapters if chapter.id == current_chapter_id),
+        None,
+    )
 
     result = []
     for chapter in chapters:
@@ -1252,11 +1266,17 @@ async def get_story_chapters(
             perfect_completion_xp=chapter.perfect_completion_xp or 150,
         ))
 
+    cache_backend.set(
+        "stories:chapters",
+        cache_key,
+        [item.model_dump() for item in result],
+        ttl_seconds=STORY_CACHE_TTL_SECONDS,
+    )
     return result
 
 
 @router.post("/{story_id}/chapters/{chapter_id}/check-goals")
-async def check_chapter_goals(
+def check_chapter_goals(
     story_id: str,
     chapter_id: str,
     request: "GoalCheckRequest",
@@ -1299,7 +1319,7 @@ async def check_chapter_goals(
 
 
 @router.post("/{story_id}/chapters/{chapter_id}/complete")
-async def complete_chapter(
+def complete_chapter(
     story_id: str,
     chapter_id: str,
     request: "ChapterCompletionRequest",
@@ -1348,11 +1368,9 @@ async def complete_chapter(
             detail=str(e),
         )
 
-    # Apply XP to user
+    # XP was credited with the progress update; achievements can follow later
     if reward.xp_earned > 0:
-        current_user.total_xp = (current_user.total_xp or 0) + reward.xp_earned
-        current_user.mark_activity()
-        db.commit()
+        _enqueue_achievement_check(current_user)
 
     # Build response
     next_chapter_read = None
@@ -1376,7 +1394,7 @@ async def complete_chapter(
 
 
 @router.post("/{story_id}/make-choice")
-async def make_narrative_choice(
+def make_narrative_choice(
     story_id: str,
     request: "NarrativeChoiceRequest",
     db: Annotated[Session, Depends(get_db)],
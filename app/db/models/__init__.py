@@ -39,7 +39,7 @@ from app.db.models.session import (
     SessionLearningMoment,
     WordInteraction,
 )
-from app.db.models.story import Chapter, Scene, Story, StoryProgress
+from app.db.models.story import Chapter, Scene, SceneImage, Story, StoryProgress
 from app.db.models.user import RefreshToken, User
 from app.db.models.vocabulary import UserConjugationProgress, VerbConjugation, VocabularyWord
 
@@ -89,6 +89,7 @@ __all__ = [
     "Story",
     "Chapter",
     "Scene",
+    "SceneImage",
     "StoryProgress",
     "NPC",
     "NPCRelationship",
@@ -2,7 +2,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -15,6 +15,22 @@ class UserError(Base):
     """Track specific user errors for spaced repetition review."""
 
     __tablename__ = "user_errors"
+    __table_args__ = (
+        # Matches the unified review queue's ordering within one user's errors
+        Index(
+            "ix_user_errors_user_review_order",
+            "user_id",
+            text("lapses DESC"),
+            text("occurrences DESC"),
+            "next_review_date",
+        ),
+        # Serves the "due or never reviewed" predicate of the review queue
+        Index(
+            "ix_user_errors_user_review_due",
+            "user_id",
+            text("COALESCE(next_review_date, '1970-01-01 00:00:00+00')"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(
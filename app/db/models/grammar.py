@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -107,6 +107,12 @@ class UserGrammarProgress(Base):
     __table_args__ = (
         Index("ix_user_grammar_progress_user_concept", "user_id", "concept_id", unique=True),
         Index("ix_user_grammar_progress_next_review", "user_id", "next_review"),
+        # Serves the "due or never reviewed" predicate of the review queue
+        Index(
+            "ix_user_grammar_progress_user_review_due",
+            "user_id",
+            text("COALESCE(next_review, '1970-01-01 00:00:00+00')"),
+        ),
     )
 
     @property
@@ -17,6 +17,7 @@ class UserVocabularyProgress(Base):
     __tablename__ = "user_vocabulary_progress"
     __table_args__ = (
         Index("uq_user_vocabulary_progress_user_word", "user_id", "word_id", unique=True),
+        Index("ix_user_vocabulary_progress_user_due_at", "user_id", "due_at"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
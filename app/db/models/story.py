@@ -1,7 +1,7 @@
 """Story and narrative content models for the RPG feature."""
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
@@ -100,6 +100,10 @@ class Chapter(Base):
     story = relationship("Story", back_populates="chapters")
     scenes = relationship("Scene", back_populates="chapter", cascade="all, delete-orphan", order_by="Scene.order_index")
 
+    __table_args__ = (
+        Index("ix_chapters_story_order", "story_id", "order_index"),
+    )
+
 
 class Scene(Base):
     """An interactive scene within a chapter."""
@@ -148,6 +152,24 @@ class Scene(Base):
     # Relationships
     chapter = relationship("Chapter", back_populates="scenes")
 
+    __table_args__ = (
+        Index("ix_scenes_chapter_order", "chapter_id", "order_index"),
+    )
+
+
+class SceneImage(Base):
+    """A generated scene illustration, kept as the durable tier behind the image cache."""
+
+    __tablename__ = "scene_images"
+
+    # Hash of the prompt and style, so identical scenes share one image
+    cache_key = Column(String(32), primary_key=True)
+    scene_id = Column(String(50))  # Scene the image was first generated for
+    style = Column(String(50), nullable=False)
+    url = Column(Text, nullable=False)
+    prompt = Column(Text, nullable=False)
+    generated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
 
 class StoryProgress(Base):
     """Tracks a user's progress and state within a story."""
@@ -185,6 +207,8 @@ class StoryProgress(Base):
     # Detailed chapter completion tracking (merged from worktree)
     chapters_completed_details = Column(JSONB().with_variant(JSON(), "sqlite"), default=list)
     # Structure: [{chapter_id: "...", completed_at: "...", xp_earned: 75, was_perfect: true, goals_completed: [...]}]
+    perfect_chapter_ids = Column(JSONB().with_variant(JSON(), "sqlite"), default=list)
+    # Structure: ["chapter_1", ...] - chapters ever completed perfectly, kept in step with the details log
 
     # Narrative choices made during branching
     narrative_choices = Column(JSONB().with_variant(JSON(), "sqlite"), default=dict)
@@ -205,6 +229,12 @@ class StoryProgress(Base):
     # Relationships
     user = relationship("User", backref="story_progress")
     story = relationship("Story")
+    # current_chapter_id carries no FK, so the join is declared explicitly
+    current_chapter = relationship(
+        "Chapter",
+        primaryjoin="foreign(StoryProgress.current_chapter_id) == Chapter.id",
+        viewonly=True,
+    )
     
     # Unique constraint: one progress per user per story
     __table_args__ = (
@@ -10,7 +10,7 @@ from sqlalchemy.sql import func
 from sqlalchemy.types import JSON
 
 from app.db.base import Base
-from app.db.types import StringList
+from app.db.types import TopicTagList
 
 
 class VocabularyWord(Base):
@@ -38,7 +38,7 @@ class VocabularyWord(Base):
     usage_notes = Column(Text)
 
     difficulty_level = Column(Integer, default=1)
-    topic_tags = Column(StringList, nullable=True)
+    topic_tags = Column(TopicTagList, nullable=True)
 
     # Anki-specific fields
     direction = Column(String(20), nullable=True)  # "fr_to_de", "de_to_fr"
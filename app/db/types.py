@@ -32,3 +32,29 @@ class StringList(TypeDecorator):
         if dialect.name == "postgresql":
             return value
         return json.loads(value)
+
+
+class TopicTagList(StringList):
+    """String list whose tags are stored stripped, lowercased and de-duplicated.
+
+    Normalizing on write keeps the stored side comparable as-is, so tag
+    lookups do not need to wrap the column in ``lower()`` and can still use
+    its index.
+    """
+
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect):  # type: ignore[override]
+        if value is not None:
+            value = normalize_topic_tags(value)
+        return super().process_bind_param(value, dialect)
+
+
+def normalize_topic_tags(tags: Any) -> list[str]:
+    """Return ``tags`` stripped and lowercased, without blanks or repeats."""
+    normalized: list[str] = []
+    for tag in tags or []:
+        cleaned = str(tag).strip().lower() if tag is not None else ""
+        if cleaned and cleaned not in normalized:
+            normalized.append(cleaned)
+    return normalized
@@ -13,6 +13,7 @@ from loguru import logger
 
 from app.api.v1 import api_router
 from app.config import settings
+from app.services.story_visualization import close_image_client, get_image_client
 
 tags_metadata: List[dict[str, str]] = [
     {"name": "auth", "description": "Register users and issue authentication tokens."},
@@ -80,6 +81,15 @@ def create_app() -> FastAPI:
                 "OPENAI_GRAPHIC_NOVEL_SCRIPT_MODEL are configured."
             )
 
+    @app.on_event("startup")
+    async def _open_image_client() -> None:
+        # Built before the first request so it does not pay for client setup
+        get_image_client()
+
+    @app.on_event("shutdown")
+    async def _close_image_client() -> None:
+        await close_image_client()
+
     return app
 
 
@@ -6,13 +6,15 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import and_, func, not_, or_, select
+from sqlalchemy import Text, and_, cast, exists, func, not_, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from app.db.models.progress import ReviewLog, UserVocabularyProgress
 from app.db.models.user import User
 from app.db.models.vocabulary import VocabularyWord
+from app.db.types import normalize_topic_tags
 from app.schemas.anki import AnkiCardUpdate
 from app.services.srs import FSRSScheduler, ReviewOutcome, SchedulerState
 from app.utils.cache import cache_backend
@@ -627,27 +629,26 @@ class ProgressService:
         exclude_word_ids: set[int],
         now: datetime,
     ) -> list[dict[str, Any]]:
-        normalized_tags = {tag.strip().lower() for tag in topic_tags if tag and tag.strip()}
+        normalized_tags = set(normalize_topic_tags(topic_tags))
         if limit <= 0 or not normalized_tags:
             return []
 
+        query = self._context_word_query(user=user, direction=direction).filter(
+            self._topic_tag_filter(normalized_tags)
+        )
+        if exclude_word_ids:
+            query = query.filter(VocabularyWord.id.notin_(sorted(exclude_word_ids)))
         candidates = (
-            self._context_word_query(user=user, direction=direction)
-            .order_by(
+            query.order_by(
                 VocabularyWord.frequency_rank.asc().nullslast(),
                 VocabularyWord.difficulty_level.asc().nullslast(),
                 func.lower(VocabularyWord.word).asc(),
             )
-            .limit(max(limit * 12, 60))
+            .limit(limit)
             .all()
         )
         selected: list[dict[str, Any]] = []
         for word in candidates:
-            if word.id in exclude_word_ids:
-                continue
-            word_tags = {tag.strip().lower() for tag in (word.topic_tags or []) if tag and tag.strip()}
-            if not normalized_tags.intersection(word_tags):
-                continue
             selected.append(
                 self._serialize_vocabulary_word_for_context(
                     user=user,
@@ -657,10 +658,23 @@ class ProgressService:
                 )
             )
             exclude_word_ids.add(word.id)
-            if len(selected) >= limit:
-                break
         return selected
 
+    def _topic_tag_filter(self, tags: set[str]):
+        """Match words carrying any of ``tags`` in the database.
+
+        Either way this is one predicate rather than an ``OR`` arm per tag:
+        PostgreSQL stores ``topic_tags`` as ``text[]``, where the overlap
+        operator can use the GIN index; SQLite keeps the list as JSON text,
+        whose elements are probed with a single ``IN``. Stored tags are
+        normalized on write by ``TopicTagList``, so both sides compare as-is.
+        """
+        ordered_tags = sorted(tags)
+        if self.db.get_bind().dialect.name == "postgresql":
+            return VocabularyWord.topic_tags.op("&&")(cast(ordered_tags, PG_ARRAY(Text)))
+        stored_tags = func.json_each(VocabularyWord.topic_tags).table_valued("value")
+        return exists().where(stored_tags.c.value.in_(ordered_tags))
+
     def _linked_vocabulary(
         self,
         *,
@@ -1,23 +1,162 @@
 """Story service for managing interactive stories and user progress."""
 from __future__ import annotations
 
+import json
+import re
+import unicodedata
 import uuid
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Sequence
 
 from loguru import logger
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import ColumnElement, Text, and_, cast, func, lambda_stmt, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Load, Session, aliased, joinedload, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.models.story import Story, Chapter, Scene, StoryProgress
 from app.db.models.npc import NPC, NPCRelationship
+from app.db.models.session import ConversationMessage
 from app.db.models.user import User
 from app.db.models.vocabulary import VocabularyWord
+from app.utils.cache import build_cache_key, cache_backend
 
 if TYPE_CHECKING:
     from app.services.progress import ProgressService
 
+# Story listings are read on every dashboard load but only change when the
+# learner's progress does. Their keys carry a per-learner version that writes
+# below bump, so stale entries are never read again and simply expire.
+STORY_CACHE_TTL_SECONDS = 60
+STORY_CACHE_VERSION_NAMESPACE = "stories:version"
+# Chapter layouts change on an editorial cadence, not per learner
+CHAPTER_GRAPH_TTL_SECONDS = 600
+
+
+def story_cache_key(user_id: uuid.UUID, suffix: str) -> str:
+    """Key a cached story listing under ``user_id``'s current cache version."""
+    version = cache_backend.get(STORY_CACHE_VERSION_NAMESPACE, str(user_id)) or 0
+    return f"{user_id}:{version}:{suffix}"
+
+
+def invalidate_story_cache(user_id: uuid.UUID) -> None:
+    """Retire every cached story listing for ``user_id`` with one counter bump."""
+    cache_backend.incr(STORY_CACHE_VERSION_NAMESPACE, str(user_id))
+
+
+def invalidate_chapter_graph(story_id: str) -> None:
+    """Drop the cached chapter graph after ``story_id``'s chapters change."""
+    cache_backend.invalidate("stories:chapter_graph", key=story_id)
+
+
+# Narration variants to try, in order, when none matches the learner's level
+_NARRATION_LEVEL_FALLBACKS: dict[str, tuple[str, ...]] = {
+    "beginner": ("A1",),
+    "A1": ("A1",),
+    "A2": ("A2", "A1"),
+    "B1": ("B1", "A2", "A1"),
+    "B2": ("B2", "B1", "A2"),
+    "C1": ("C1", "B2", "B1"),
+    "C2": ("C1", "B2"),
+    "advanced": ("C1", "B2"),
+}
+
+# Goal checks tokenise every transcript; compile the pattern once
+_WORD_RE = re.compile(r'\b\w+\b')
+# (suffix, minimum word length) in the order they are tried when stemming.
+# Common French verb infinitive endings first, then past participles and
+# other forms; "oir" is shadowed by "ir", as it always has been.
+_STEM_SUFFIXES = (
+    ("er", 0),
+    ("ir", 0),
+    ("re", 0),
+    ("oir", 0),
+    ("e", 4),
+    ("u", 4),
+)
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison (lowercase, remove accents)."""
+    normalized = unicodedata.normalize('NFD', text.lower())
+    return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+
+
+# Words repeat across messages and sessions; whole transcripts go through
+# _normalize_text directly so they never crowd the cache
+_normalize_word = lru_cache(maxsize=4096)(_normalize_text)
+
+
+@lru_cache(maxsize=4096)
+def _get_french_stem(normalized: str) -> str:
+    """Get approximate stem of an already normalized French word."""
+    for suffix, min_length in _STEM_SUFFIXES:
+        if normalized.endswith(suffix) and len(normalized) >= min_length:
+            return normalized[:-len(suffix)]
+    return normalized
+
+
+# The chapter fields callers serialize for a "next chapter" summary; the
+# narrative JSON on the row is left unloaded.
+_CHAPTER_SUMMARY_COLUMNS = (
+    Chapter.id,
+    Chapter.story_id,
+    Chapter.order_index,
+    Chapter.title,
+    Chapter.target_level,
+)
+
+
+def _json_array_append(db: Session, column, item):
+    """Build an UPDATE expression appending ``item`` to a JSON array column."""
+    if db.get_bind().dialect.name == "postgresql":
+        empty = cast(literal("[]", Text), JSONB)
+        # Columns added as plain json (e.g. chapters_completed_details) have
+        # no || operator, so the stored side is cast as well
+        return func.coalesce(cast(column, JSONB), empty).op("||", return_type=JSONB)(
+            cast(literal(json.dumps([item]), Text), JSONB)
+        )
+    # SQLite keeps JSON as text; json_insert with "$[#]" appends in place
+    return func.json_insert(
+        func.coalesce(column, literal("[]", Text)), "$[#]", func.json(literal(json.dumps(item), Text))
+    )
+
+
+def _json_object_set(db: Session, column, key: str, value):
+    """Build an UPDATE expression setting ``key`` on a JSON object column."""
+    if db.get_bind().dialect.name == "postgresql":
+        empty = cast(literal("{}", Text), JSONB)
+        # Merging a one-key object replaces that key and keeps the rest
+        return func.coalesce(cast(column, JSONB), empty).op("||", return_type=JSONB)(
+            cast(literal(json.dumps({key: value}), Text), JSONB)
+        )
+    return func.json_set(
+        func.coalesce(column, literal("{}", Text)),
+        f"$.{json.dumps(key)}",
+        func.json(literal(json.dumps(value), Text)),
+    )
+
+
+def normalize_narrative_goals(goals: list[dict] | None) -> list[dict]:
+    """Attach pre-normalized ``required_words`` and their stems to each goal.
+
+    Chapter writers call this so ``check_narrative_goals`` can match against
+    ``required_words_normalized`` and ``required_stems`` without
+    re-normalizing or re-stemming on every check.
+    """
+    normalized_goals = []
+    for goal in goals or []:
+        normalized = [_normalize_word(word) for word in goal.get("required_words", [])]
+        normalized_goals.append({
+            **goal,
+            "required_words_normalized": normalized,
+            "required_stems": [_get_french_stem(word) for word in normalized],
+        })
+    return normalized_goals
+
 
 @dataclass
 class StoryListItem:
@@ -82,38 +221,59 @@ class Consequence:
     value: any
 
 
+def _story_list_item_from_cache(payload: dict) -> StoryListItem:
+    """Rebuild a cached ``StoryListItem`` from its JSON form."""
+    progress = payload.pop("progress")
+    if progress is not None:
+        last_played_at = progress["last_played_at"]
+        progress = StoryProgressSummary(
+            **{**progress, "last_played_at": datetime.fromisoformat(last_played_at) if last_played_at else None}
+        )
+    return StoryListItem(**payload, progress=progress)
+
+
 class StoryService:
     """Service for managing stories and user progress."""
 
     def __init__(self, db: Session):
         self.db = db
+        # Progress rows already loaded by this (request-scoped) service, so
+        # repeated lookups within a request reuse the session's instance
+        self._progress_by_story: dict[tuple[uuid.UUID, str], StoryProgress] = {}
 
     def list_available_stories(self, user: User) -> list[StoryListItem]:
         """List stories available for the user's level."""
+        user_level = user.proficiency_level or "beginner"
+        cache_key = story_cache_key(user.id, user_level)
+        cached = cache_backend.get("stories:list", cache_key)
+        if cached is not None:
+            return [_story_list_item_from_cache(item) for item in cached]
         
-        # Get all active stories
-        stmt = select(Story).where(Story.is_active == True).order_by(Story.title)
-        stories = self.db.execute(stmt).scalars().all()
+        # Stories, the user's progress and the current chapter title in one round trip
+        stmt = (
+            select(Story, StoryProgress, Chapter.title)
+            .outerjoin(
+                StoryProgress,
+                and_(StoryProgress.story_id == Story.id, StoryProgress.user_id == user.id),
+            )
+            .outerjoin(Chapter, Chapter.id == StoryProgress.current_chapter_id)
+            .where(Story.is_active == True)
+            .order_by(Story.title)
+        )
         
-        # Get user's progress for all stories
-        progress_stmt = select(StoryProgress).where(StoryProgress.user_id == user.id)
-        progress_records = {p.story_id: p for p in self.db.execute(progress_stmt).scalars().all()}
+        # Keep one row per story; a later progress row wins, as before
+        rows: dict[str, tuple[Story, StoryProgress | None, str | None]] = {}
+        for story, progress, chapter_title in self.db.execute(stmt).all():
+            rows[story.id] = (story, progress, chapter_title)
         
         result = []
-        for story in stories:
+        for story, progress, chapter_title in rows.values():
             # Check if user level allows access
-            user_level = user.proficiency_level or "beginner"
             is_unlocked = self._check_level_unlock(story.target_levels, user_level)
             
             # Get progress summary if exists
             progress_summary = None
-            if story.id in progress_records:
-                progress = progress_records[story.id]
-                chapter_title = None
-                if progress.current_chapter_id:
-                    chapter = self.db.get(Chapter, progress.current_chapter_id)
-                    chapter_title = chapter.title if chapter else None
-                
+            if progress is not None:
                 progress_summary = StoryProgressSummary(
                     current_chapter_title=chapter_title,
                     completion_percentage=progress.completion_percentage or 0,
@@ -135,6 +295,12 @@ class StoryService:
                 progress=progress_summary,
             ))
         
+        cache_backend.set(
+            "stories:list",
+            cache_key,
+            [asdict(item) for item in result],
+            ttl_seconds=STORY_CACHE_TTL_SECONDS,
+        )
         return result
 
     def _check_level_unlock(self, target_levels: list[str] | None, user_level: str) -> bool:
@@ -147,11 +313,27 @@ class StoryService:
 
     def get_story_progress(self, user: User, story_id: str) -> StoryProgress | None:
         """Get user's progress in a specific story."""
-        stmt = select(StoryProgress).where(
-            StoryProgress.user_id == user.id,
-            StoryProgress.story_id == story_id,
+        user_id = user.id
+        progress = self._progress_by_story.get((user_id, story_id))
+        if progress is not None:
+            return progress
+        
+        # Called on nearly every story request: as a lambda statement it is
+        # built and compiled once, later calls only bind the new parameters.
+        # The current chapter is joined in, so later db.get(Chapter, ...)
+        # lookups for it are answered from the identity map.
+        stmt = lambda_stmt(
+            lambda: select(StoryProgress)
+            .where(
+                StoryProgress.user_id == user_id,
+                StoryProgress.story_id == story_id,
+            )
+            .options(joinedload(StoryProgress.current_chapter))
         )
-        return self.db.execute(stmt).scalar_one_or_none()
+        progress = self.db.execute(stmt).scalar_one_or_none()
+        if progress is not None:
+            self._progress_by_story[(user_id, story_id)] = progress
+        return progress
 
     def start_story(self, user: User, story_id: str) -> StoryStartResult:
         """Start a new story playthrough or resume existing."""
@@ -168,47 +350,43 @@ class StoryService:
             scene = self.get_current_scene(user, story_id)
             return StoryStartResult(progress=existing, scene=scene)
         
-        # Get first chapter and scene
-        first_chapter = self.db.execute(
-            select(Chapter)
-            .where(Chapter.story_id == story_id)
-            .order_by(Chapter.order_index)
-            .limit(1)
-        ).scalar_one_or_none()
-        
-        if not first_chapter:
+        # Get first chapter and scene from the cached chapter graph
+        graph = self._load_chapter_graph(story_id)
+        first_chapter_id = next(iter(graph), None)
+        if first_chapter_id is None:
             raise ValueError(f"Story has no chapters: {story_id}")
         
-        first_scene = self.db.execute(
-            select(Scene)
-            .where(Scene.chapter_id == first_chapter.id)
-            .order_by(Scene.order_index)
-            .limit(1)
-        ).scalar_one_or_none()
-        
-        if not first_scene:
-            raise ValueError(f"Chapter has no scenes: {first_chapter.id}")
+        first_scene_id = graph[first_chapter_id]["first_scene_id"]
+        if not first_scene_id:
+            raise ValueError(f"Chapter has no scenes: {first_chapter_id}")
         
-        # Create new progress
+        # Create new progress; timestamps are set here rather than by the
+        # server defaults so the row needs no refresh after commit
+        now = datetime.now(timezone.utc)
         progress = StoryProgress(
             user_id=user.id,
             story_id=story_id,
-            current_chapter_id=first_chapter.id,
-            current_scene_id=first_scene.id,
+            current_chapter_id=first_chapter_id,
+            current_scene_id=first_scene_id,
             story_flags={},
             player_choices=[],
             philosophical_learnings=[],
             book_quotes_unlocked=[],
             chapters_completed=[],
+            perfect_chapter_ids=[],
             completion_percentage=0,
             status="in_progress",
+            started_at=now,
+            last_played_at=now,
         )
         self.db.add(progress)
-        self.db.commit()
-        self.db.refresh(progress)
+        self._progress_by_story[(user.id, story_id)] = progress
         
-        # Build scene context
-        scene_context = self._build_scene_context(user, story, first_chapter, first_scene, progress)
+        # Build scene context; the new progress and any relationships it
+        # creates go out in the same commit
+        scene_context = self._current_scene_context(user, progress)
+        self.db.commit()
+        invalidate_story_cache(user.id)
         
         return StoryStartResult(progress=progress, scene=scene_context)
 
@@ -216,17 +394,38 @@ class StoryService:
         """Get the current scene context for a user's story progress."""
         
         progress = self.get_story_progress(user, story_id)
-        if not progress or not progress.current_scene_id:
+        if not progress:
             return None
         
-        story = self.db.get(Story, story_id)
-        chapter = self.db.get(Chapter, progress.current_chapter_id)
-        scene = self.db.get(Scene, progress.current_scene_id)
+        context = self._current_scene_context(user, progress)
+        if self.db.new:
+            # First visit to this scene's NPCs: persist the new relationships
+            self.db.commit()
+        return context
+
+    def _current_scene_context(self, user: User, progress: StoryProgress) -> SceneContext | None:
+        """Build the context for ``progress``'s current scene without committing."""
+        if not progress.current_scene_id:
+            return None
         
-        if not all([story, chapter, scene]):
+        scene = self._load_scene(progress.current_scene_id)
+        if scene is None:
             return None
         
-        return self._build_scene_context(user, story, chapter, scene, progress)
+        return self._build_scene_context(user, scene.chapter.story, scene.chapter, scene, progress)
+
+    def _load_scene(self, scene_id: str) -> Scene | None:
+        """Load a scene together with its chapter and story, or ``None``."""
+        # Scene, chapter and story in one statement
+        scene = self.db.execute(
+            select(Scene)
+            .where(Scene.id == scene_id)
+            .options(joinedload(Scene.chapter).joinedload(Chapter.story))
+        ).scalar_one_or_none()
+        
+        if scene is None or scene.chapter is None or scene.chapter.story is None:
+            return None
+        return scene
 
     def _build_scene_context(
         self,
@@ -242,19 +441,23 @@ class StoryService:
         user_level = user.proficiency_level or "A1"
         narration = self._get_narration_for_level(scene.narration_variants, user_level)
         
-        # Get NPC contexts
+        # Get NPC contexts: the scene's NPCs and their relationships are
+        # each fetched with a single IN query
         npc_contexts = []
         npc_ids = scene.npcs_present or []
-        for npc_id in npc_ids:
-            npc = self.db.get(NPC, npc_id)
-            if npc:
-                relationship = self._get_or_create_relationship(user, npc_id)
-                npc_contexts.append(NPCContext(
-                    npc=npc,
-                    relationship_level=relationship.level,
-                    trust=relationship.trust,
-                    mood=relationship.mood,
-                ))
+        npcs_by_id = {}
+        if npc_ids:
+            npcs_by_id = {npc.id: npc for npc in self.db.scalars(select(NPC).where(NPC.id.in_(npc_ids)))}
+        npcs = [npcs_by_id[npc_id] for npc_id in npc_ids if npc_id in npcs_by_id]
+        relationships = self._get_or_create_relationships(user, npcs)
+        for npc in npcs:
+            relationship = relationships[npc.id]
+            npc_contexts.append(NPCContext(
+                npc=npc,
+                relationship_level=relationship.level,
+                trust=relationship.trust,
+                mood=relationship.mood,
+            ))
         
         return SceneContext(
             scene=scene,
@@ -277,51 +480,53 @@ class StoryService:
             return variants[user_level]
         
         # Fall back to simplified levels
-        level_fallbacks = {
-            "beginner": ["A1"],
-            "A1": ["A1"],
-            "A2": ["A2", "A1"],
-            "B1": ["B1", "A2", "A1"],
-            "B2": ["B2", "B1", "A2"],
-            "C1": ["C1", "B2", "B1"],
-            "C2": ["C1", "B2"],
-            "advanced": ["C1", "B2"],
-        }
-        
-        for fallback in level_fallbacks.get(user_level, ["A1"]):
+        for fallback in _NARRATION_LEVEL_FALLBACKS.get(user_level, ("A1",)):
             if fallback in variants:
                 return variants[fallback]
         
         # Return first available
         return next(iter(variants.values()), "")
 
-    def _get_or_create_relationship(self, user: User, npc_id: str) -> NPCRelationship:
-        """Get or create a relationship between user and NPC."""
-        stmt = select(NPCRelationship).where(
-            NPCRelationship.user_id == user.id,
-            NPCRelationship.npc_id == npc_id,
-        )
-        relationship = self.db.execute(stmt).scalar_one_or_none()
+    def _get_or_create_relationships(self, user: User, npcs: list[NPC]) -> dict[str, NPCRelationship]:
+        """Get or create the user's relationships with ``npcs``, keyed by NPC id.
+
+        New relationships are only added to the session; the caller commits
+        them together with the rest of its changes.
+        """
+        if not npcs:
+            return {}
+        relationships: dict[str, NPCRelationship] = {}
+        for relationship in self.db.scalars(
+            select(NPCRelationship).where(
+                NPCRelationship.user_id == user.id,
+                NPCRelationship.npc_id.in_([npc.id for npc in npcs]),
+            )
+        ):
+            relationships.setdefault(relationship.npc_id, relationship)
         
-        if not relationship:
-            # Get NPC's default relationship config
-            npc = self.db.get(NPC, npc_id)
+        now = datetime.now(timezone.utc)
+        created = []
+        for npc in npcs:
+            if npc.id in relationships:
+                continue
+            # Start from the NPC's default relationship config
             initial_level = 1
-            if npc and npc.relationship_config:
+            if npc.relationship_config:
                 initial_level = npc.relationship_config.get("initial_level", 1)
-            
             relationship = NPCRelationship(
                 user_id=user.id,
-                npc_id=npc_id,
+                npc_id=npc.id,
                 level=initial_level,
                 trust=0,
                 mood="neutral",
+                first_interaction_at=now,
+                last_interaction_at=now,
             )
-            self.db.add(relationship)
-            self.db.commit()
-            self.db.refresh(relationship)
+            relationships[npc.id] = relationship
+            created.append(relationship)
         
-        return relationship
+        self.db.add_all(created)
+        return relationships
 
     def advance_scene(
         self,
@@ -350,9 +555,11 @@ class StoryService:
                 break
         
         if not next_scene_id:
-            # Try to go to next scene in order
-            next_scene = self.db.execute(
-                select(Scene)
+            # Try to go to next scene in order. The bare column comparison and
+            # LIMIT 1 let ix_scenes_chapter_order stop after the first entry;
+            # only the id is needed, the scene itself is loaded below.
+            next_scene_id = self.db.execute(
+                select(Scene.id)
                 .where(
                     Scene.chapter_id == current_scene.chapter_id,
                     Scene.order_index > current_scene.order_index,
@@ -361,25 +568,28 @@ class StoryService:
                 .limit(1)
             ).scalar_one_or_none()
             
-            if next_scene:
-                next_scene_id = next_scene.id
-            else:
+            if not next_scene_id:
                 # Try next chapter
                 return self._advance_to_next_chapter(user, progress)
         
         if not next_scene_id:
             return None
         
-        # Update progress
-        next_scene = self.db.get(Scene, next_scene_id)
+        # Update progress; the scene arrives with its chapter and story
+        next_scene = self._load_scene(next_scene_id)
         if not next_scene:
             return None
         
         progress.current_scene_id = next_scene_id
         progress.last_played_at = datetime.now(timezone.utc)
+        # One commit for the move and any relationships the new scene creates
+        context = self._build_scene_context(
+            user, next_scene.chapter.story, next_scene.chapter, next_scene, progress
+        )
         self.db.commit()
+        invalidate_story_cache(user.id)
         
-        return self.get_current_scene(user, story_id)
+        return context
 
     def _check_transition_condition(
         self,
@@ -410,60 +620,56 @@ class StoryService:
     ) -> SceneContext | None:
         """Advance to the first scene of the next chapter."""
         
-        current_chapter = self.db.get(Chapter, progress.current_chapter_id)
-        if not current_chapter:
+        graph = self._load_chapter_graph(progress.story_id)
+        current_links = graph.get(progress.current_chapter_id)
+        if current_links is None:
             return None
         
-        # Mark current chapter as completed
-        completed = progress.chapters_completed or []
-        if current_chapter.id not in completed:
-            completed.append(current_chapter.id)
+        # Mark current chapter as completed. JSON columns only notice a new
+        # list, so append by building one rather than mutating in place.
+        completed = list(progress.chapters_completed or ())
+        if progress.current_chapter_id not in completed:
+            completed.append(progress.current_chapter_id)
             progress.chapters_completed = completed
         
-        # Find next chapter
-        next_chapter = self.db.execute(
-            select(Chapter)
-            .where(
-                Chapter.story_id == progress.story_id,
-                Chapter.order_index > current_chapter.order_index,
-            )
-            .order_by(Chapter.order_index)
-            .limit(1)
-        ).scalar_one_or_none()
+        now = datetime.now(timezone.utc)
+        # Find next chapter; the graph is ordered by order_index
+        next_chapter_id = next(
+            (
+                chapter_id
+                for chapter_id, links in graph.items()
+                if links["order_index"] > current_links["order_index"]
+            ),
+            None,
+        )
         
-        if not next_chapter:
+        if not next_chapter_id:
             # Story complete
             progress.status = "completed"
             progress.completion_percentage = 100
-            progress.completed_at = datetime.now(timezone.utc)
+            progress.completed_at = now
             self.db.commit()
+            invalidate_story_cache(user.id)
             return None
         
         # Get first scene of next chapter
-        first_scene = self.db.execute(
-            select(Scene)
-            .where(Scene.chapter_id == next_chapter.id)
-            .order_by(Scene.order_index)
-            .limit(1)
-        ).scalar_one_or_none()
-        
-        if not first_scene:
+        first_scene_id = graph[next_chapter_id]["first_scene_id"]
+        if not first_scene_id:
             return None
         
         # Update progress
-        progress.current_chapter_id = next_chapter.id
-        progress.current_scene_id = first_scene.id
-        progress.last_played_at = datetime.now(timezone.utc)
+        progress.current_chapter_id = next_chapter_id
+        progress.current_scene_id = first_scene_id
+        progress.last_played_at = now
         
-        # Calculate completion percentage
-        total_chapters = self.db.execute(
-            select(Chapter).where(Chapter.story_id == progress.story_id)
-        ).scalars().all()
-        progress.completion_percentage = int(len(completed) / len(total_chapters) * 100)
+        # Calculate completion percentage; the graph holds every chapter
+        progress.completion_percentage = int(len(completed) / len(graph) * 100)
         
+        context = self._current_scene_context(user, progress)
         self.db.commit()
+        invalidate_story_cache(user.id)
         
-        return self.get_current_scene(user, progress.story_id)
+        return context
 
     def set_story_flag(self, user: User, story_id: str, flag: str, value: any = True) -> None:
         """Set a story flag in the user's progress."""
@@ -471,10 +677,11 @@ class StoryService:
         if not progress:
             return
         
-        flags = progress.story_flags or {}
-        flags[flag] = value
-        progress.story_flags = flags
-        self.db.commit()
+        # Set the one key server-side instead of rewriting the whole object,
+        # so concurrent writers setting different flags do not clobber each other
+        self._update_progress(
+            progress, story_flags=_json_object_set(self.db, StoryProgress.story_flags, flag, value)
+        )
 
     def record_player_choice(
         self,
@@ -488,13 +695,25 @@ class StoryService:
         if not progress:
             return
         
-        choices = progress.player_choices or []
-        choices.append({
+        choice = {
             "scene_id": scene_id,
             "choice_id": choice_id,
             "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
-        progress.player_choices = choices
+        }
+        self._update_progress(
+            progress, player_choices=_json_array_append(self.db, StoryProgress.player_choices, choice)
+        )
+
+    def _update_progress(self, progress: StoryProgress, **values) -> None:
+        """Apply server-side column updates to ``progress`` and commit them."""
+        self.db.execute(
+            update(StoryProgress)
+            .where(StoryProgress.id == progress.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        # Reload the touched columns lazily if anyone reads them afterwards
+        self.db.expire(progress, list(values))
         self.db.commit()
 
     def add_philosophical_learning(self, user: User, story_id: str, learning: str) -> None:
@@ -504,10 +723,10 @@ class StoryService:
             return
         
         learnings = progress.philosophical_learnings or []
-        if learning not in learnings:
-            learnings.append(learning)
-            progress.philosophical_learnings = learnings
-            self.db.commit()
+        if learning in learnings:
+            return
+        progress.philosophical_learnings = [*learnings, learning]
+        self.db.commit()
 
     def unlock_book_quote(self, user: User, story_id: str, quote_id: str) -> None:
         """Unlock a book quote for the user."""
@@ -516,10 +735,10 @@ class StoryService:
             return
         
         quotes = progress.book_quotes_unlocked or []
-        if quote_id not in quotes:
-            quotes.append(quote_id)
-            progress.book_quotes_unlocked = quotes
-            self.db.commit()
+        if quote_id in quotes:
+            return
+        progress.book_quotes_unlocked = [*quotes, quote_id]
+        self.db.commit()
 
     def queue_scene_vocabulary(
         self,
@@ -543,35 +762,43 @@ class StoryService:
         if not vocab_list:
             return queued_words
         
-        # Find matching vocabulary words in the database
+        # vocab_item can be a string (word) or dict with word/translation
+        word_texts: list[str] = []
         for vocab_item in vocab_list:
-            # vocab_item can be a string (word) or dict with word/translation
             if isinstance(vocab_item, str):
                 word_text = vocab_item
             elif isinstance(vocab_item, dict):
                 word_text = vocab_item.get("word", vocab_item.get("term", ""))
             else:
                 continue
-            
-            if not word_text:
-                continue
-            
-            # Find the vocabulary word
-            vocab_word = self.db.execute(
-                select(VocabularyWord).where(
-                    VocabularyWord.normalized_word == word_text.lower()
+            if word_text:
+                word_texts.append(word_text)
+        if not word_texts:
+            return queued_words
+        
+        # Find matching vocabulary words in one query: by normalized form,
+        # falling back to an exact word match
+        words_by_normalized: dict[str, VocabularyWord] = {}
+        words_by_text: dict[str, VocabularyWord] = {}
+        for vocab_word in self.db.execute(
+            select(VocabularyWord)
+            .where(
+                or_(
+                    VocabularyWord.normalized_word.in_({text.lower() for text in word_texts}),
+                    VocabularyWord.word.in_(set(word_texts)),
                 )
-            ).scalar_one_or_none()
-            
-            if not vocab_word:
-                # Try by exact word match
-                vocab_word = self.db.execute(
-                    select(VocabularyWord).where(
-                        VocabularyWord.word == word_text
-                    )
-                ).scalar_one_or_none()
+            )
+            .order_by(VocabularyWord.id)
+        ).scalars():
+            words_by_normalized.setdefault(vocab_word.normalized_word, vocab_word)
+            words_by_text.setdefault(vocab_word.word, vocab_word)
+        
+        queued_ids: set[int] = set()
+        for word_text in word_texts:
+            vocab_word = words_by_normalized.get(word_text.lower()) or words_by_text.get(word_text)
             
-            if vocab_word:
+            if vocab_word and vocab_word.id not in queued_ids:
+                queued_ids.add(vocab_word.id)
                 # Get or create progress entry (this adds it to the queue)
                 progress_service.get_or_create_progress(
                     user_id=user.id,
@@ -602,8 +829,14 @@ class StoryService:
         """
         learning_focus = chapter.learning_focus or {}
         vocab_list = learning_focus.get("vocabulary", [])
+        # Keyed on the chapter's word list too, so editing it needs no explicit
+        # invalidation; vocabulary details are picked up again on expiry
+        cache_key = build_cache_key(chapter_id=chapter.id, vocabulary=vocab_list)
+        cached = cache_backend.get("stories:chapter_vocabulary", cache_key)
+        if cached is not None:
+            return cached
         
-        result = []
+        entries: dict[str, tuple[str, str | None]] = {}
         for vocab_item in vocab_list:
             if isinstance(vocab_item, str):
                 word_text = vocab_item
@@ -614,16 +847,30 @@ class StoryService:
             else:
                 continue
             
-            if not word_text:
-                continue
-            
-            # Look up full vocabulary word details
-            vocab_word = self.db.execute(
-                select(VocabularyWord).where(
-                    VocabularyWord.normalized_word == word_text.lower()
-                )
-            ).scalar_one_or_none()
-            
+            if word_text and word_text.lower() not in entries:
+                entries[word_text.lower()] = (word_text, translation)
+        if not entries:
+            return []
+        
+        # Look up the displayed word details in one round trip, as plain rows
+        words_by_normalized = {}
+        for vocab_word in self.db.execute(
+            select(
+                VocabularyWord.id,
+                VocabularyWord.normalized_word,
+                VocabularyWord.word,
+                VocabularyWord.english_translation,
+                VocabularyWord.definition,
+                VocabularyWord.example_sentence,
+            )
+            .where(VocabularyWord.normalized_word.in_(list(entries)))
+            .order_by(VocabularyWord.id)
+        ):
+            words_by_normalized.setdefault(vocab_word.normalized_word, vocab_word)
+        
+        result = []
+        for normalized_word, (word_text, translation) in entries.items():
+            vocab_word = words_by_normalized.get(normalized_word)
             if vocab_word:
                 result.append({
                     "id": vocab_word.id,
@@ -644,6 +891,9 @@ class StoryService:
                     "from_story": True,
                 })
 
+        cache_backend.set(
+            "stories:chapter_vocabulary", cache_key, result, ttl_seconds=CHAPTER_GRAPH_TTL_SECONDS
+        )
         return result
 
     # ------------------------------------------------------------------
@@ -666,111 +916,94 @@ class StoryService:
         Returns:
             GoalCheckResult with completed and remaining goal IDs
         """
-        from app.db.models.session import ConversationMessage
-        import unicodedata
-        import re
-
-        def normalize_text(text: str) -> str:
-            """Normalize text for comparison (lowercase, remove accents)."""
-            normalized = unicodedata.normalize('NFD', text.lower())
-            return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-
-        def get_french_stem(word: str) -> str:
-            """Get approximate stem for French word matching."""
-            normalized = normalize_text(word)
-            # Common French verb infinitive endings
-            if normalized.endswith('er'):
-                return normalized[:-2]
-            if normalized.endswith('ir'):
-                return normalized[:-2]
-            if normalized.endswith('re'):
-                return normalized[:-2]
-            if normalized.endswith('oir'):
-                return normalized[:-3]
-            # Handle past participles and other forms
-            if normalized.endswith('e') and len(normalized) > 3:
-                return normalized[:-1]
-            if normalized.endswith('u') and len(normalized) > 3:
-                return normalized[:-1]
-            return normalized
-
-        def word_matches(required_word: str, text_words: list[str], full_text: str) -> bool:
-            """Check if required word (or its conjugated form) appears in user text."""
-            normalized_required = normalize_text(required_word)
-            required_stem = get_french_stem(required_word)
-
-            # Direct match check
-            if normalized_required in full_text:
-                return True
-
-            # Stem-based matching for verbs
-            for user_word in text_words:
-                normalized_user = normalize_text(user_word)
-                user_stem = get_french_stem(user_word)
-
-                # Check exact normalized match
-                if normalized_user == normalized_required:
-                    return True
-
-                # Check stem match (for verb conjugations)
-                # e.g., "cherch" matches "cherche", "chercher", "cherché"
-                if len(required_stem) >= 4:  # Only stem-match for words with substantial stems
-                    if normalized_user.startswith(required_stem):
-                        return True
-                    if user_stem == required_stem:
-                        return True
-
-                # Special handling for French irregular verbs
-                # disparaître -> disparu, dispara-, dispar-
-                if 'dispar' in normalized_required and 'dispar' in normalized_user:
-                    return True
-                if 'trouv' in normalized_required and 'trouv' in normalized_user:
-                    return True
-
-            return False
-
-        # Get all user messages for this session
+        # Combine all user message content in the database: one string comes
+        # back instead of a row per message (string_agg / group_concat)
         stmt = (
-            select(ConversationMessage)
+            select(func.aggregate_strings(ConversationMessage.content, " "))
             .where(
                 ConversationMessage.session_id == session_id,
                 ConversationMessage.sender == "user"
             )
         )
-        user_messages = self.db.execute(stmt).scalars().all()
+        all_user_text = self.db.execute(stmt).scalar() or ""
+        normalized_full_text = _normalize_text(all_user_text)
+
+        # Normalise the transcript once so each required word is a few probes.
+        # Tokens are kept sorted, so a stem lookup is one binary search: the
+        # stem "cherch" matches "cherché" without rescanning every token.
+        normalized_user_words = {_normalize_word(word) for word in _WORD_RE.findall(all_user_text)}
+        sorted_user_words = sorted(normalized_user_words)
+
+        def starts_user_word(prefix: str) -> bool:
+            index = bisect_left(sorted_user_words, prefix)
+            return index < len(sorted_user_words) and sorted_user_words[index].startswith(prefix)
+        # Special handling for French irregular verbs
+        # disparaître -> disparu, dispara-, dispar-
+        irregular_roots = {
+            root for root in ('dispar', 'trouv')
+            if any(root in word for word in normalized_user_words)
+        }
 
-        # Combine all user message content
-        all_user_text = " ".join(msg.content for msg in user_messages)
-        normalized_full_text = normalize_text(all_user_text)
+        def word_matches(normalized_required: str, required_stem: str) -> bool:
+            """Check if a normalized required word (or its conjugated form) appears in user text."""
+            # Anywhere in the transcript, as goals have always matched: phrases,
+            # elided forms and words inside longer ones ("venir" in "devenir")
+            if normalized_required in normalized_full_text:
+                return True
 
-        # Extract individual words from user text
-        user_words = re.findall(r'\b\w+\b', all_user_text)
+            # Check stem match (for verb conjugations)
+            # e.g., "cherch" matches "cherche", "chercher", "cherché". A user
+            # word whose own stem equals this one also starts with it.
+            if len(required_stem) >= 4:  # Only stem-match for words with substantial stems
+                if starts_user_word(required_stem):
+                    return True
 
-        # Check each narrative goal
-        completed_goals = []
-        narrative_goals = chapter.narrative_goals or []
+            return any(root in normalized_required for root in irregular_roots)
 
-        for goal in narrative_goals:
-            goal_id = goal["goal_id"]
-            required_words = goal.get("required_words", [])
+        narrative_goals = chapter.narrative_goals or []
 
-            if not required_words:
-                continue
+        # Chapters written through normalize_narrative_goals carry the
+        # normalized words; older rows are normalized here instead
+        goal_words = [
+            (
+                goal,
+                goal.get("required_words_normalized")
+                or [_normalize_word(word) for word in goal.get("required_words", [])],
+            )
+            for goal in narrative_goals
+            if goal.get("required_words")
+        ]
+        # Stems are stored next to the normalized words too; only rows
+        # written before that are stemmed here
+        required_stems: dict[str, str] = {}
+        for goal, words in goal_words:
+            stems = goal.get("required_stems")
+            if stems and len(stems) == len(words):
+                required_stems.update(zip(words, stems))
+        for _, words in goal_words:
+            for word in words:
+                if word not in required_stems:
+                    required_stems[word] = _get_french_stem(word)
+        # Goals often share words: match each distinct word once, then score
+        # every goal against the resulting set
+        matched_words = {
+            word for word, stem in required_stems.items() if word_matches(word, stem)
+        }
 
-            matched = [
-                word
-                for word in required_words
-                if word_matches(word, user_words, normalized_full_text)
-            ]
+        # Check each narrative goal
+        completed_goals = []
+        for goal, normalized_required_words in goal_words:
+            hits = sum(1 for word in normalized_required_words if word in matched_words)
             # Default to requiring at least one match unless the goal specifies otherwise
             minimum_hits = max(1, int(goal.get("min_required", 1)))
-            minimum_hits = min(minimum_hits, len(required_words))
+            minimum_hits = min(minimum_hits, len(goal["required_words"]))
 
-            if len(matched) >= minimum_hits:
-                completed_goals.append(goal_id)
+            if hits >= minimum_hits:
+                completed_goals.append(goal["goal_id"])
 
+        completed_ids = set(completed_goals)
         remaining_goals = [
-            g["goal_id"] for g in narrative_goals if g["goal_id"] not in completed_goals
+            g["goal_id"] for g in narrative_goals if g["goal_id"] not in completed_ids
         ]
 
         completion_rate = (
@@ -783,6 +1016,63 @@ class StoryService:
             completion_rate=completion_rate,
         )
 
+    def _load_chapter_graph(self, story_id: str) -> dict[str, dict]:
+        """Return the story's chapter links keyed by chapter id, cached per story.
+
+        Each entry carries ``order_index``, ``default_next_chapter_id`` and
+        ``first_scene_id``: enough to move a learner between chapters without
+        reading chapter or scene rows. Branching choices are left out; they
+        are read from the current chapter row, so edits apply immediately.
+        """
+        cached = cache_backend.get("stories:chapter_graph", story_id)
+        if cached is not None:
+            return cached
+
+        first_scene_order = (
+            select(Scene.chapter_id, func.min(Scene.order_index).label("order_index"))
+            .join(Chapter, Chapter.id == Scene.chapter_id)
+            .where(Chapter.story_id == story_id)
+            .group_by(Scene.chapter_id)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(
+                Chapter.id,
+                Chapter.order_index,
+                Chapter.default_next_chapter_id,
+                Scene.id,
+            )
+            .outerjoin(first_scene_order, first_scene_order.c.chapter_id == Chapter.id)
+            .outerjoin(
+                Scene,
+                and_(Scene.chapter_id == Chapter.id, Scene.order_index == first_scene_order.c.order_index),
+            )
+            .where(Chapter.story_id == story_id)
+            .order_by(Chapter.order_index)
+        ).all()
+
+        graph: dict[str, dict] = {}
+        for chapter_id, order_index, default_next_chapter_id, first_scene_id in rows:
+            graph.setdefault(chapter_id, {
+                "order_index": order_index,
+                "default_next_chapter_id": default_next_chapter_id,
+                "first_scene_id": first_scene_id,
+            })
+        cache_backend.set("stories:chapter_graph", story_id, graph, ttl_seconds=CHAPTER_GRAPH_TTL_SECONDS)
+        return graph
+
+    def _chapter_links(self, story_id: str, chapter_id: str) -> dict | None:
+        """Look up one chapter in the cached graph, reloading it once on a miss."""
+        links = self._load_chapter_graph(story_id).get(chapter_id)
+        if links is None:
+            invalidate_chapter_graph(story_id)
+            links = self._load_chapter_graph(story_id).get(chapter_id)
+        return links
+
+    def _load_chapter_summary(self, chapter_id: str) -> Chapter | None:
+        """Load a chapter with only the columns a next-chapter summary needs."""
+        return self.db.get(Chapter, chapter_id, options=[load_only(*_CHAPTER_SUMMARY_COLUMNS)])
+
     def complete_chapter_with_goals(
         self,
         user: User,
@@ -790,7 +1080,10 @@ class StoryService:
         session_id: uuid.UUID,
         goal_results: "GoalCheckResult",
     ) -> "ChapterCompletionReward":
-        """Award XP, unlock next chapter, check achievements.
+        """Award XP and unlock the next chapter in a single commit.
+
+        Achievement checks are left to the caller to schedule off the
+        request path.
 
         Args:
             user: Current user
@@ -804,13 +1097,35 @@ class StoryService:
         Raises:
             ValueError: If chapter not found or user has no progress for this story
         """
-        # Load chapter
-        chapter = self.db.get(Chapter, chapter_id)
-        if not chapter:
+        # Chapter, the user's progress, the default next chapter and the
+        # story's chapter count in a single round trip
+        next_chapter_alias = aliased(Chapter)
+        sibling_chapter = aliased(Chapter)
+        total_chapters_subquery = (
+            select(func.count(sibling_chapter.id))
+            .where(sibling_chapter.story_id == Chapter.story_id)
+            .correlate(Chapter)
+            .scalar_subquery()
+        )
+        row = self.db.execute(
+            select(Chapter, StoryProgress, next_chapter_alias, total_chapters_subquery)
+            .outerjoin(
+                StoryProgress,
+                and_(StoryProgress.story_id == Chapter.story_id, StoryProgress.user_id == user.id),
+            )
+            .outerjoin(next_chapter_alias, next_chapter_alias.id == Chapter.default_next_chapter_id)
+            .where(Chapter.id == chapter_id)
+            .options(
+                load_only(*(getattr(next_chapter_alias, column.key) for column in _CHAPTER_SUMMARY_COLUMNS)),
+                # load_only on a same-class alias also narrows the plain
+                # entity, so keep the completed chapter fully loaded
+                Load(Chapter).undefer("*"),
+            )
+        ).first()
+        if row is None:
             raise ValueError(f"Chapter {chapter_id} not found")
+        chapter, progress, default_next_chapter, total_chapters = row
 
-        # Get user's story progress
-        progress = self.get_story_progress(user, chapter.story_id)
         if not progress:
             raise ValueError(f"User has no progress for story {chapter.story_id}")
 
@@ -822,35 +1137,43 @@ class StoryService:
         # Calculate XP
         is_perfect = goal_results.completion_rate == 1.0 and goals_met
         xp_earned = chapter.perfect_completion_xp if is_perfect else chapter.completion_xp
-
-        # Update detailed completion tracking
-        chapters_completed_details = progress.chapters_completed_details or []
-        chapters_completed_details.append({
-            "chapter_id": chapter.id,
-            "completed_at": datetime.now(timezone.utc).isoformat(),
-            "xp_earned": xp_earned,
-            "was_perfect": is_perfect,
-            "goals_completed": goal_results.goals_completed,
-        })
-        progress.chapters_completed_details = chapters_completed_details
-
+        now = datetime.now(timezone.utc)
+
+        # Append the completion record and bump the counters server-side so
+        # the growing JSON lists are never read back and rewritten whole
+        completion_values = {
+            "chapters_completed_details": _json_array_append(
+                self.db,
+                StoryProgress.chapters_completed_details,
+                {
+                    "chapter_id": chapter.id,
+                    "completed_at": now.isoformat(),
+                    "xp_earned": xp_earned,
+                    "was_perfect": is_perfect,
+                    "goals_completed": goal_results.goals_completed,
+                },
+            ),
+            "total_xp_earned": func.coalesce(StoryProgress.total_xp_earned, 0) + xp_earned,
+        }
         # Update simple completion list too
-        chapters_completed = progress.chapters_completed or []
-        if chapter.id not in chapters_completed:
-            chapters_completed.append(chapter.id)
-            progress.chapters_completed = chapters_completed
-
-        # Update XP tracking
-        progress.total_xp_earned = (progress.total_xp_earned or 0) + xp_earned
+        completed_count = len(progress.chapters_completed or [])
+        if chapter.id not in (progress.chapters_completed or []):
+            completion_values["chapters_completed"] = _json_array_append(
+                self.db, StoryProgress.chapters_completed, chapter.id
+            )
+            completed_count += 1
         if is_perfect:
-            progress.perfect_chapters_count = (progress.perfect_chapters_count or 0) + 1
+            completion_values["perfect_chapters_count"] = (
+                func.coalesce(StoryProgress.perfect_chapters_count, 0) + 1
+            )
+            if chapter.id not in (progress.perfect_chapter_ids or []):
+                completion_values["perfect_chapter_ids"] = _json_array_append(
+                    self.db, StoryProgress.perfect_chapter_ids, chapter.id
+                )
 
         # Calculate completion percentage
-        total_chapters = self.db.execute(
-            select(Chapter).where(Chapter.story_id == chapter.story_id)
-        ).scalars().all()
-        progress.completion_percentage = int(
-            len(chapters_completed) / len(total_chapters) * 100
+        completion_values["completion_percentage"] = int(
+            completed_count / total_chapters * 100
         ) if total_chapters else 0
 
         # Determine next chapter
@@ -858,53 +1181,61 @@ class StoryService:
         story_completed = False
 
         if chapter.default_next_chapter_id:
-            next_chapter = self.db.get(Chapter, chapter.default_next_chapter_id)
-            if next_chapter:
-                progress.current_chapter_id = next_chapter.id
-                # Get first scene of next chapter
-                first_scene = self.db.execute(
-                    select(Scene)
-                    .where(Scene.chapter_id == next_chapter.id)
-                    .order_by(Scene.order_index)
-                    .limit(1)
-                ).scalar_one_or_none()
-                if first_scene:
-                    progress.current_scene_id = first_scene.id
+            next_chapter = default_next_chapter
         else:
             # Check for next chapter by order_index
-            next_by_order = self.db.execute(
-                select(Chapter)
-                .where(
-                    Chapter.story_id == chapter.story_id,
-                    Chapter.order_index > chapter.order_index,
-                )
-                .order_by(Chapter.order_index)
-                .limit(1)
-            ).scalar_one_or_none()
+            graph = self._load_chapter_graph(chapter.story_id)
+            next_chapter_id = next(
+                (
+                    chapter_id
+                    for chapter_id, links in graph.items()
+                    if links["order_index"] > chapter.order_index
+                ),
+                None,
+            )
+            next_chapter = self._load_chapter_summary(next_chapter_id) if next_chapter_id else None
 
-            if next_by_order:
-                next_chapter = next_by_order
-                progress.current_chapter_id = next_chapter.id
-                # Get first scene
-                first_scene = self.db.execute(
-                    select(Scene)
-                    .where(Scene.chapter_id == next_chapter.id)
-                    .order_by(Scene.order_index)
-                    .limit(1)
-                ).scalar_one_or_none()
-                if first_scene:
-                    progress.current_scene_id = first_scene.id
-            else:
+            if not next_chapter:
                 # No next chapter - story is complete
                 story_completed = True
-                progress.status = "completed"
-                progress.completion_percentage = 100
-                progress.completed_at = datetime.now(timezone.utc)
+                completion_values["status"] = "completed"
+                completion_values["completion_percentage"] = 100
+                completion_values["completed_at"] = now
+
+        if next_chapter:
+            completion_values["current_chapter_id"] = next_chapter.id
+            # Get first scene of next chapter
+            links = self._chapter_links(chapter.story_id, next_chapter.id)
+            if links and links["first_scene_id"]:
+                completion_values["current_scene_id"] = links["first_scene_id"]
+
+        completion_values["last_played_at"] = now
+
+        # Every progress change goes out in this one UPDATE
+        self.db.execute(
+            update(StoryProgress)
+            .where(StoryProgress.id == progress.id)
+            .values(**completion_values)
+            .execution_options(synchronize_session=False)
+        )
+        # Plain values are known already; only the server-computed columns
+        # are reloaded, lazily, if anyone reads them afterwards
+        for key, value in completion_values.items():
+            if isinstance(value, ColumnElement):
+                self.db.expire(progress, [key])
+            else:
+                set_committed_value(progress, key, value)
+        if next_chapter:
+            self.db.expire(progress, ["current_chapter"])
 
-        progress.last_played_at = datetime.now(timezone.utc)
+        # Credit the learner in the same transaction as the progress update
+        if xp_earned > 0:
+            user.total_xp = (user.total_xp or 0) + xp_earned
+            user.mark_activity()
 
+        # Every field read back below was just assigned here, so no refresh
         self.db.commit()
-        self.db.refresh(progress)
+        invalidate_story_cache(user.id)
 
         return ChapterCompletionReward(
             xp_earned=xp_earned,
@@ -937,51 +1268,53 @@ class StoryService:
         if not progress:
             raise ValueError("No progress found for this story")
 
-        current_chapter = self.db.get(Chapter, progress.current_chapter_id)
-        if not current_chapter:
+        # The progress query joined the current chapter in; its choices are
+        # read from that row rather than the cached graph, so chapter edits
+        # apply immediately
+        current_chapter = progress.current_chapter if progress.current_chapter_id else None
+        if current_chapter is None:
             raise ValueError("No current chapter")
 
         # Find the choice in branching_choices
-        choices = current_chapter.branching_choices or []
         choice = next(
-            (c for c in choices if c["choice_id"] == choice_id),
+            (
+                candidate
+                for candidate in current_chapter.branching_choices or []
+                if candidate.get("choice_id") == choice_id
+            ),
             None,
         )
-
         if not choice:
             raise ValueError(f"Invalid choice_id: {choice_id}")
 
         # Record choice in narrative_choices
-        narrative_choices = progress.narrative_choices or {}
-        narrative_choices[current_chapter.id] = choice_id
-        progress.narrative_choices = narrative_choices
+        progress.narrative_choices = {
+            **(progress.narrative_choices or {}),
+            progress.current_chapter_id: choice_id,
+        }
 
         # Get next chapter based on choice
         next_chapter_id = choice.get("next_chapter_id") or current_chapter.default_next_chapter_id
         if not next_chapter_id:
             raise ValueError("No next chapter specified for this choice")
 
-        next_chapter = self.db.get(Chapter, next_chapter_id)
-        if not next_chapter:
+        links = self._chapter_links(story_id, next_chapter_id)
+        if links is None:
             raise ValueError(f"Next chapter {next_chapter_id} not found")
+        next_chapter = self._load_chapter_summary(next_chapter_id)
 
         # Update current chapter
         progress.current_chapter_id = next_chapter_id
+        self.db.expire(progress, ["current_chapter"])
 
         # Get first scene of next chapter
-        first_scene = self.db.execute(
-            select(Scene)
-            .where(Scene.chapter_id == next_chapter_id)
-            .order_by(Scene.order_index)
-            .limit(1)
-        ).scalar_one_or_none()
-        if first_scene:
-            progress.current_scene_id = first_scene.id
+        if links["first_scene_id"]:
+            progress.current_scene_id = links["first_scene_id"]
 
         progress.last_played_at = datetime.now(timezone.utc)
 
         self.db.commit()
-        self.db.refresh(progress)
+        invalidate_story_cache(user.id)
 
         return NextChapterResult(
             next_chapter=next_chapter,
@@ -7,18 +7,23 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 import httpx
 from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.db.models.story import Scene, Chapter, Story
+from app.db.models.story import Scene, SceneImage, Chapter, Story
 from app.db.models.user import User
+from app.services.graphic_novel_image_storage import GraphicNovelImageStorage
 from app.utils.cache import cache_backend
 
 
@@ -55,25 +60,173 @@ THEME_TO_STYLE = {
 }
 
 
+# Atmosphere keywords used when no theme picks a style, in priority order
+ATMOSPHERE_TO_STYLE = {
+    "tense": "dramatic",
+    "dark": "dramatic",
+    "magical": "fantasy",
+    "wonder": "fantasy",
+    "peaceful": "whimsical",
+    "calm": "whimsical",
+}
+
+
+def _keyword_matcher(keywords: dict[str, str]):
+    """Compile a finder returning the style of the highest-priority keyword in a text."""
+    
+    priority = {keyword: rank for rank, keyword in enumerate(keywords)}
+    pattern = re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    
+    def find(text: str) -> str | None:
+        found = pattern.findall(text)
+        if not found:
+            return None
+        return keywords[min(found, key=priority.__getitem__)]
+    
+    return find
+
+
+_theme_style = _keyword_matcher(THEME_TO_STYLE)
+_atmosphere_style = _keyword_matcher(ATMOSPHERE_TO_STYLE)
+
+
+# Prompts and styles depend only on plain fields, so repeated requests for the
+# same scene or cover skip rebuilding them.
+@lru_cache(maxsize=1024)
+def _style_for(themes: tuple[str, ...], atmosphere: str | None) -> str | None:
+    """Pick an art style from story themes, then scene atmosphere."""
+    
+    for theme in themes:
+        style = _theme_style(theme.lower())
+        if style:
+            return style
+    
+    # Default based on scene atmosphere
+    if atmosphere:
+        return _atmosphere_style(atmosphere.lower())
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _scene_prompt(
+    description: str | None,
+    location: str | None,
+    atmosphere: str | None,
+    npcs: tuple[str, ...],
+    source_book: str | None,
+    avatar_desc: str | None,
+    style_description: str,
+) -> str:
+    """Build the image prompt for a scene."""
+    
+    parts = []
+    
+    # Scene description
+    if description:
+        parts.append(f"Scene: {description[:200]}")
+    
+    # Location
+    if location:
+        parts.append(f"Setting: {location}")
+    
+    # Atmosphere
+    if atmosphere:
+        parts.append(f"Mood: {atmosphere}")
+    
+    # Characters (NPCs)
+    if npcs:
+        parts.append(f"Characters present: {', '.join(npcs)}")
+    
+    # Book context
+    if source_book:
+        parts.append(f"From the story: {source_book}")
+    
+    # User avatar placeholder
+    if avatar_desc:
+        parts.append(f"Include a figure representing the reader: {avatar_desc}")
+    
+    # Style and format
+    parts.append(f"\nArt style: {style_description}")
+    parts.append("Create an immersive illustration suitable for a language learning storybook.")
+    parts.append("No text or letters in the image. Focus on visual storytelling.")
+    
+    return "\n".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _chapter_cover_prompt(chapter_title: str, story_title: str | None, style_description: str) -> str:
+    """Build the image prompt for a chapter title page."""
+    
+    return f"""A beautiful book chapter title page illustration.
+Title: "{chapter_title}"
+{f"From the book: {story_title}" if story_title else ""}
+
+Style: {style_description}
+The image should be evocative and set the mood for the chapter.
+No text or letters in the image."""
+
+
+@lru_cache(maxsize=256)
+def _story_cover_prompt(
+    title: str,
+    author: str | None,
+    themes: tuple[str, ...],
+    style_description: str,
+) -> str:
+    """Build the image prompt for a story's book cover."""
+    
+    return f"""A beautiful book cover illustration.
+Title: "{title}"
+Author: "{author or 'Unknown'}"
+
+Themes: {', '.join(themes) if themes else 'General'}
+
+Style: {style_description}
+Create a high-quality, artistic book cover design.
+No text or letters in the image, just the artwork."""
+
+
+# One client per process, so every service instance reuses its pooled connections
+_image_client: httpx.AsyncClient | None = None
+
+
+def get_image_client() -> httpx.AsyncClient:
+    """Return the process-wide client for the image generation API."""
+    global _image_client
+    if _image_client is None or _image_client.is_closed:
+        _image_client = httpx.AsyncClient(
+            timeout=60.0,
+            headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"},
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _image_client
+
+
+async def close_image_client() -> None:
+    """Close the shared image client and its connections."""
+    global _image_client
+    if _image_client is not None:
+        await _image_client.aclose()
+        _image_client = None
+
+
 class StoryVisualizationService:
     """Generate AI visualizations for story scenes."""
     
     CACHE_TTL_SECONDS = 86400 * 7  # 1 week cache
+    # The API's own image URLs expire after about an hour
+    UNSTORED_IMAGE_TTL_SECONDS = 50 * 60
+    STORY_CONTEXT_TTL_SECONDS = 3600
     DEFAULT_STYLE = "whimsical"
     
     def __init__(self, db: Session) -> None:
         self.db = db
         self.api_key = settings.OPENAI_API_KEY
-        self._client: httpx.AsyncClient | None = None
     
     @property
     def client(self) -> httpx.AsyncClient:
-        if not self._client:
-            self._client = httpx.AsyncClient(
-                timeout=60.0,
-                headers={"Authorization": f"Bearer {self.api_key}"}
-            )
-        return self._client
+        return get_image_client()
     
     async def generate_scene_image(
         self,
@@ -94,8 +247,21 @@ class StoryVisualizationService:
         Returns:
             GeneratedImage with URL and metadata
         """
-        # Check cache first
-        cache_key = self._get_cache_key(scene.id, style_override, include_avatar)
+        # Get chapter and story for context
+        story_context = self._get_story_context(scene.chapter_id)
+        
+        # Determine art style
+        style = style_override or self._determine_style(story_context.get("themes"), scene.atmosphere)
+        style_description = ART_STYLES.get(style, ART_STYLES[self.DEFAULT_STYLE])
+        
+        # Build the prompt
+        prompt = self._build_image_prompt(
+            scene, story_context.get("source_book"), style_description, include_avatar, user
+        )
+        
+        # Check cache first: keyed on what is drawn, so identical scenes
+        # share an image wherever they appear
+        cache_key = self._get_cache_key(prompt, style)
         cached = cache_backend.get("story:visuals", cache_key)
         if cached:
             logger.debug("Returning cached scene image", scene_id=scene.id)
@@ -104,23 +270,29 @@ class StoryVisualizationService:
                 prompt=cached["prompt"],
                 style=cached["style"],
                 cached=True,
-                generated_at=datetime.fromisoformat(cached["generated_at"]),
+                generated_at=datetime.fromtimestamp(cached["generated_at"], tz=timezone.utc),
             )
         
-        # Get chapter and story for context
-        chapter = self.db.get(Chapter, scene.chapter_id)
-        story = self.db.get(Story, chapter.story_id) if chapter else None
-        
-        # Determine art style
-        style = style_override or self._determine_style(story, scene)
-        style_description = ART_STYLES.get(style, ART_STYLES[self.DEFAULT_STYLE])
-        
-        # Build the prompt
-        prompt = self._build_image_prompt(scene, chapter, story, style_description, include_avatar, user)
+        # Fall back to the stored image when the cache entry was evicted
+        stored = self.db.get(SceneImage, cache_key)
+        if stored is not None:
+            logger.debug("Returning stored scene image", scene_id=scene.id)
+            result = GeneratedImage(
+                url=stored.url,
+                prompt=stored.prompt,
+                style=stored.style,
+                cached=True,
+                generated_at=stored.generated_at,
+            )
+            self._cache_image(cache_key, result, ttl_seconds=self.CACHE_TTL_SECONDS)
+            return result
         
         # Generate the image
         try:
             image_url = await self._call_dalle(prompt)
+            image_url, stored = await self._persist_image(
+                image_url, owner_id=f"story-scene-{scene.id}", role="scene"
+            )
         except Exception as e:
             logger.error("Image generation failed", error=str(e), scene_id=scene.id)
             # Return a fallback/placeholder
@@ -131,7 +303,7 @@ class StoryVisualizationService:
                 cached=False,
             )
         
-        # Cache the result
+        # Store and cache the result
         result = GeneratedImage(
             url=image_url,
             prompt=prompt,
@@ -140,16 +312,27 @@ class StoryVisualizationService:
             generated_at=datetime.now(timezone.utc),
         )
         
-        cache_backend.set(
-            "story:visuals",
+        if stored:
+            # Only images copied to our storage outlive the API's expiring URL
+            self.db.add(
+                SceneImage(
+                    cache_key=cache_key,
+                    scene_id=scene.id,
+                    style=style,
+                    url=image_url,
+                    prompt=prompt,
+                    generated_at=result.generated_at,
+                )
+            )
+            try:
+                self.db.commit()
+            except IntegrityError:
+                # Generated concurrently elsewhere; either image will do
+                self.db.rollback()
+        self._cache_image(
             cache_key,
-            {
-                "url": image_url,
-                "prompt": prompt,
-                "style": style,
-                "generated_at": result.generated_at.isoformat(),
-            },
-            ttl_seconds=self.CACHE_TTL_SECONDS,
+            result,
+            ttl_seconds=self.CACHE_TTL_SECONDS if stored else self.UNSTORED_IMAGE_TTL_SECONDS,
         )
         
         logger.info(
@@ -168,21 +351,18 @@ class StoryVisualizationService:
     ) -> GeneratedImage:
         """Generate a cover image for a chapter."""
         
-        story = self.db.get(Story, chapter.story_id)
-        style = style_override or self._determine_style(story, None)
+        story_context = self._get_story_context(chapter.id)
+        style = style_override or self._determine_style(story_context.get("themes"), None)
         style_description = ART_STYLES.get(style, ART_STYLES[self.DEFAULT_STYLE])
         
         # Build cover prompt
-        prompt = f"""A beautiful book chapter title page illustration.
-Title: "{chapter.title}"
-{f"From the book: {story.title}" if story else ""}
-
-Style: {style_description}
-The image should be evocative and set the mood for the chapter.
-No text or letters in the image."""
+        prompt = _chapter_cover_prompt(chapter.title, story_context.get("story_title"), style_description)
         
         try:
             image_url = await self._call_dalle(prompt)
+            image_url, _ = await self._persist_image(
+                image_url, owner_id=f"story-chapter-{chapter.id}", role="cover"
+            )
         except Exception as e:
             logger.error("Chapter cover generation failed", error=str(e))
             image_url = self._get_fallback_image(style)
@@ -202,22 +382,20 @@ No text or letters in the image."""
     ) -> GeneratedImage:
         """Generate a cover image for a story (book cover)."""
         
-        style = style_override or self._determine_style(story, None)
+        style = style_override or self._determine_style(story.themes, None)
         style_description = ART_STYLES.get(style, ART_STYLES[self.DEFAULT_STYLE])
         
         # Create a rich prompt for the book cover
-        prompt = f"""A beautiful book cover illustration.
-Title: "{story.title}"
-Author: "{story.source_author or 'Unknown'}"
-
-Themes: {', '.join(story.themes[:3]) if story.themes else 'General'}
-
-Style: {style_description}
-Create a high-quality, artistic book cover design.
-No text or letters in the image, just the artwork."""
+        prompt = _story_cover_prompt(
+            story.title,
+            story.source_author,
+            tuple(story.themes[:3]) if story.themes else (),
+            style_description,
+        )
         
         try:
             image_url = await self._call_dalle(prompt)
+            image_url, _ = await self._persist_image(image_url, owner_id=f"story-{story.id}", role="cover")
             
             # Update story with new cover URL
             story.cover_image_url = image_url
@@ -240,73 +418,70 @@ No text or letters in the image, just the artwork."""
             generated_at=datetime.now(timezone.utc),
         )
     
+    def _cache_image(self, cache_key: str, image: GeneratedImage, *, ttl_seconds: int) -> None:
+        """Keep a scene image in the shared cache for quick repeat lookups."""
+        cache_backend.set(
+            "story:visuals",
+            cache_key,
+            {
+                "url": image.url,
+                "prompt": image.prompt,
+                "style": image.style,
+                "generated_at": int(image.generated_at.timestamp()),
+            },
+            ttl_seconds=ttl_seconds,
+        )
+    
+    def _get_story_context(self, chapter_id: str) -> dict:
+        """Return the chapter's story details used in prompts, cached per chapter.
+
+        Story and chapter rows do not change during play, so one joined
+        lookup per chapter serves every scene image and cover request.
+        """
+        cached = cache_backend.get("story:visual_context", chapter_id)
+        if cached is not None:
+            return cached
+        
+        row = self.db.execute(
+            select(Story.title, Story.source_book, Story.themes)
+            .join(Chapter, Chapter.story_id == Story.id)
+            .where(Chapter.id == chapter_id)
+        ).first()
+        context = {}
+        if row is not None:
+            context = {"story_title": row.title, "source_book": row.source_book, "themes": row.themes or []}
+        cache_backend.set(
+            "story:visual_context", chapter_id, context, ttl_seconds=self.STORY_CONTEXT_TTL_SECONDS
+        )
+        return context
+    
     def _build_image_prompt(
         self,
         scene: Scene,
-        chapter: Chapter | None,
-        story: Story | None,
+        source_book: str | None,
         style_description: str,
         include_avatar: bool,
         user: User | None,
     ) -> str:
         """Build a detailed prompt for scene visualization."""
         
-        parts = []
-        
-        # Scene description
-        if scene.description:
-            parts.append(f"Scene: {scene.description[:200]}")
-        
-        # Location
-        if scene.location:
-            parts.append(f"Setting: {scene.location}")
-        
-        # Atmosphere
-        if scene.atmosphere:
-            parts.append(f"Mood: {scene.atmosphere}")
-        
-        # Characters (NPCs)
-        if scene.npcs_present:
-            npc_names = ", ".join(scene.npcs_present[:3])
-            parts.append(f"Characters present: {npc_names}")
-        
-        # Book context
-        if story and story.source_book:
-            parts.append(f"From the story: {story.source_book}")
-        
-        # User avatar placeholder
+        avatar_desc = None
         if include_avatar and user:
             avatar_desc = user.avatar_description if hasattr(user, 'avatar_description') else "a young person"
-            parts.append(f"Include a figure representing the reader: {avatar_desc}")
-        
-        # Style and format
-        parts.append(f"\nArt style: {style_description}")
-        parts.append("Create an immersive illustration suitable for a language learning storybook.")
-        parts.append("No text or letters in the image. Focus on visual storytelling.")
-        
-        return "\n".join(parts)
+        return _scene_prompt(
+            scene.description,
+            scene.location,
+            scene.atmosphere,
+            tuple(scene.npcs_present[:3]) if scene.npcs_present else (),
+            source_book,
+            avatar_desc,
+            style_description,
+        )
     
-    def _determine_style(self, story: Story | None, scene: Scene | None) -> str:
+    def _determine_style(self, themes: list[str] | None, atmosphere: str | None) -> str:
         """Determine the best art style based on story themes."""
         
-        if story and story.themes:
-            for theme in story.themes:
-                theme_lower = theme.lower()
-                for key in THEME_TO_STYLE:
-                    if key in theme_lower:
-                        return THEME_TO_STYLE[key]
-        
-        # Default based on scene atmosphere
-        if scene and scene.atmosphere:
-            atmo = scene.atmosphere.lower()
-            if "tense" in atmo or "dark" in atmo:
-                return "dramatic"
-            if "magical" in atmo or "wonder" in atmo:
-                return "fantasy"
-            if "peaceful" in atmo or "calm" in atmo:
-                return "whimsical"
-        
-        return self.DEFAULT_STYLE
+        return _style_for(tuple(themes) if themes else (), atmosphere) or self.DEFAULT_STYLE
     
     async def _call_dalle(self, prompt: str, size: str = "1024x1024") -> str:
         """Call DALL-E API to generate an image."""
@@ -330,10 +505,29 @@ No text or letters in the image, just the artwork."""
         
         return data["data"][0]["url"]
     
-    def _get_cache_key(self, scene_id: str, style: str | None, include_avatar: bool) -> str:
-        """Generate a cache key for a scene visualization."""
-        key_parts = f"{scene_id}:{style or 'auto'}:{include_avatar}"
-        return hashlib.md5(key_parts.encode()).hexdigest()
+    async def _persist_image(self, image_url: str, *, owner_id: str, role: str) -> tuple[str, bool]:
+        """Copy a generated image to our own storage.
+
+        Returns the URL to use and whether it points at our storage. The
+        API's image URLs expire within the hour; with ``data_uri`` storage
+        configured, or when storing fails, that URL is returned as is.
+        """
+        try:
+            payload = await GraphicNovelImageStorage().persist_payload(
+                {"url": image_url},
+                scene_id=owner_id,
+                panel_index=0,
+                image_role=role,
+            )
+        except Exception as e:
+            logger.warning("Generated image could not be stored", error=str(e), owner_id=owner_id)
+            return image_url, False
+        return payload["url"], "storage" in payload
+    
+    def _get_cache_key(self, prompt: str, style: str) -> str:
+        """Generate a cache key for a scene visualization from its prompt."""
+        key_parts = f"{style}:{prompt}"
+        return hashlib.blake2b(key_parts.encode(), digest_size=16).hexdigest()
     
     def _get_fallback_image(self, style: str) -> str:
         """Return a fallback placeholder image URL."""
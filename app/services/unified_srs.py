@@ -7,23 +7,38 @@ Research-backed design:
 """
 from __future__ import annotations
 
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
-from datetime import date, datetime, time, timedelta, timezone
+from datetime import UTC, date, datetime, timedelta
 from enum import Enum
-
-from typing import Any, Literal
+from functools import partial
+from typing import Any
 from uuid import UUID
 
+import numpy as np
 from loguru import logger
-from sqlalchemy import and_, desc, not_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    desc,
+    func,
+    lambda_stmt,
+    literal_column,
+    not_,
+    or_,
+    select,
+)
+from sqlalchemy.orm import Session, joinedload
 
 from app.db.models.error import UserError
 from app.db.models.grammar import GrammarConcept, UserGrammarProgress
 from app.db.models.progress import UserVocabularyProgress
 from app.db.models.user import User
 from app.db.models.vocabulary import UserConjugationProgress, VocabularyWord
-from app.services.conjugation import ConjugationService, DISPLAY_TENSES
+from app.services.conjugation import DISPLAY_TENSES, ConjugationService
 from app.services.enhanced_srs import EnhancedSRSService
 from app.services.grammar import GrammarService
 from app.services.progress import (
@@ -31,6 +46,7 @@ from app.services.progress import (
     vocabulary_due_filter,
     vocabulary_progress_due_at,
 )
+from app.utils.cache import build_cache_key, cache_backend
 
 
 class ItemType(str, Enum):
@@ -46,7 +62,7 @@ class InterleavingMode(str, Enum):
     PRIORITY = "priority"  # Strict priority order
 
 
-@dataclass
+@dataclass(slots=True)
 class DueLearningItem:
     """Normalized representation of any learning item."""
     
@@ -63,8 +79,17 @@ class DueLearningItem:
     original_id: int | UUID = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Scheduler state read by priority scoring
+    stability: float = 0.0
+    lapses: int = 0
+
 
-@dataclass
+# Deferred construction of an item's full metadata, run only for items that
+# make it into the final queue
+MetadataBuilder = Callable[[], dict[str, Any]]
+
+
+@dataclass(slots=True)
 class DailyPracticeSummary:
     """Overview of today's practice workload."""
     
@@ -74,7 +99,7 @@ class DailyPracticeSummary:
     by_type: dict[str, dict[str, int]]  # {vocab: {due: 30, new: 5, minutes: 28}, ...}
 
 
-@dataclass 
+@dataclass(slots=True)
 class DailyPracticeSession:
     """Complete session with queue and settings."""
     
@@ -100,7 +125,42 @@ BASE_PRIORITY = {
     ItemType.VOCAB: 10,
 }
 
+# Round-robin order of item types in an interleaved queue
+INTERLEAVE_ORDER = (ItemType.ERROR, ItemType.GRAMMAR, ItemType.CONJUGATION, ItemType.VOCAB)
+
+# Grammar score (0-10) recorded per FSRS rating (0=Again .. 3=Easy), for a
+# direct grammar review and for the credit a reviewed linked error passes on
+GRAMMAR_REVIEW_SCORES = (1.0, 4.0, 7.0, 9.5)
+ERROR_GRAMMAR_CREDIT_SCORES = (2.0, 4.0, 7.5, 9.0)
+
+# Integer code per item type, indexing the per-type arrays used for scoring
+ITEM_TYPE_CODES = {item_type: code for code, item_type in enumerate(ItemType)}
+BASE_PRIORITY_BY_CODE = np.array([BASE_PRIORITY[item_type] for item_type in ItemType], dtype=float)
+
+# Most due items of each type pulled into one practice queue
+VOCAB_FETCH_LIMIT = 100
+GRAMMAR_FETCH_LIMIT = 50
+ERROR_FETCH_LIMIT = 30
+CONJUGATION_FETCH_LIMIT = 40
+
+# Queue requests whose four fetches may run in parallel at once. Each one
+# holds four pooled connections, so this stays well below what SessionLocal
+# allows (pool_size 10 + max_overflow 20); further requests fetch serially.
+CONCURRENT_FETCH_LIMIT = 4
+SERIAL_FETCH_DIALECTS = {"sqlite"}
+_fetch_slots = threading.BoundedSemaphore(CONCURRENT_FETCH_LIMIT)
+_fetch_executor = ThreadPoolExecutor(max_workers=CONCURRENT_FETCH_LIMIT * 4, thread_name_prefix="unified-srs")
+
+# Dashboards poll the due counts; they may lag reviews made outside the
+# unified queue by up to this long
+DUE_SUMMARY_CACHE_NAMESPACE = "srs:due_summary"
+DUE_SUMMARY_TTL_SECONDS = 60
+
 MASTERED_STATES = {"mastered", "gemeistert"}
+# Stand-in review time for never-reviewed items, so "due or never reviewed"
+# is a single comparison. Rendered inline to match the expression indexes on
+# user_grammar_progress and user_errors.
+NEVER_REVIEWED = literal_column("'1970-01-01 00:00:00+00'")
 TASK_COMPLIANCE = "task_compliance"
 ERROR_SOURCE_LABELS = {
     "atelier": "Atelier",
@@ -123,6 +183,8 @@ class UnifiedSRSService:
     def serialize_item(item: DueLearningItem) -> dict[str, Any]:
         """Return an API-safe dict for a unified queue item."""
         payload = asdict(item)
+        # Scoring inputs already travel in metadata
+        del payload["stability"], payload["lapses"]
         payload["item_type"] = item.item_type.value
         if isinstance(item.original_id, UUID):
             payload["original_id"] = str(item.original_id)
@@ -130,15 +192,41 @@ class UnifiedSRSService:
     
     def get_due_summary(self, user_id: UUID) -> DailyPracticeSummary:
         """Get summary of all due items for today."""
-        now = datetime.now(timezone.utc)
+        cache_key = build_cache_key(user_id=str(user_id))
+        cached = cache_backend.get(DUE_SUMMARY_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            return self._build_summary(*cached)
+
+        now = datetime.now(UTC)
         today = now.date()
         target_language = self._target_language(user_id)
 
-        vocab_due = self._due_vocab_query(user_id, today, now, target_language).count()
-        grammar_due = self._due_grammar_query(user_id, now, target_language).count()
-        errors_due = self._due_error_query(user_id, now).count()
-        conjugation_due = self._due_conjugation_query(user_id, now).count()
-        
+        # All four counts in a single round trip
+        vocab_due, grammar_due, errors_due, conjugation_due = self.db.execute(
+            select(
+                *(
+                    stmt.with_only_columns(func.count(), maintain_column_froms=True).scalar_subquery()
+                    for stmt in (
+                        self._due_vocab_query(user_id, vocabulary_due_filter(now), target_language),
+                        self._due_grammar_query(user_id, now, target_language),
+                        self._due_error_query(user_id, now),
+                        self._due_conjugation_query(user_id, now, today),
+                    )
+                )
+            )
+        ).one()
+        cache_backend.set(
+            DUE_SUMMARY_CACHE_NAMESPACE,
+            cache_key,
+            [vocab_due, grammar_due, errors_due, conjugation_due],
+            ttl_seconds=DUE_SUMMARY_TTL_SECONDS,
+        )
+        return self._build_summary(vocab_due, grammar_due, errors_due, conjugation_due)
+
+    @staticmethod
+    def _build_summary(
+        vocab_due: int, grammar_due: int, errors_due: int, conjugation_due: int
+    ) -> DailyPracticeSummary:
         by_type = {
             "vocab": {
                 "due": vocab_due,
@@ -191,24 +279,33 @@ class UnifiedSRSService:
         
         Returns queue that optionally fits within time budget.
         """
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         today = now.date()
-        target_language = self._target_language(user_id)
-        
-        items: list[DueLearningItem] = []
         
         # Fetch all due items
-        items.extend(self._fetch_due_vocab(user_id, today, now, target_language))
-        items.extend(self._fetch_due_grammar(user_id, now, target_language))
-        items.extend(self._fetch_due_errors(user_id, now))
-        items.extend(self._fetch_due_conjugations(user_id, now))
-        
-        # Calculate priority scores
-        for item in items:
-            item.priority_score = self._calculate_priority(item)
+        vocab_items, grammar_items, error_items, conjugation_items = self._fetch_all_due(user_id, today, now)
+        fetched_pairs = vocab_items + grammar_items + error_items + conjugation_items
+        items: list[DueLearningItem] = [item for item, _ in fetched_pairs]
+        metadata_builders = {item.id: build for item, build in fetched_pairs}
+
+        # The fetches hold every due item unless one was cut off at its limit
+        fetched = (
+            (vocab_items, VOCAB_FETCH_LIMIT),
+            (grammar_items, GRAMMAR_FETCH_LIMIT),
+            (error_items, ERROR_FETCH_LIMIT),
+            (conjugation_items, CONJUGATION_FETCH_LIMIT),
+        )
+        if any(len(fetched_items) >= limit for fetched_items, limit in fetched):
+            summary = self.get_due_summary(user_id)
+        else:
+            summary = self._build_summary(*(len(fetched_items) for fetched_items, _ in fetched))
         
-        # Sort by priority (highest first)
-        items.sort(key=lambda x: x.priority_score, reverse=True)
+        # Calculate priority scores and sort by them (highest first, ties
+        # keep fetch order)
+        scores = self._calculate_priorities(items)
+        for item, score in zip(items, scores.tolist(), strict=True):
+            item.priority_score = score
+        items = [items[index] for index in np.argsort(-scores, kind="stable").tolist()]
         
         # Apply interleaving mode
         if interleaving_mode == InterleavingMode.RANDOM:
@@ -219,8 +316,11 @@ class UnifiedSRSService:
         # Apply time budget if specified
         if time_budget_minutes:
             items = self._apply_time_budget(items, time_budget_minutes * 60)
-        
-        summary = self.get_due_summary(user_id)
+
+        # Fetches only carried the scoring inputs; fill in the rest for the
+        # items actually returned
+        for item in items:
+            item.metadata = metadata_builders[item.id]()
         
         return DailyPracticeSession(
             summary=summary,
@@ -245,59 +345,106 @@ class UnifiedSRSService:
         fsrs_rating = rating - 1  # 0=Again, 1=Hard, 2=Good, 3=Easy
 
         if item_type == ItemType.VOCAB:
-            return self._complete_vocab_item(
+            result = self._complete_vocab_item(
                 user_id=user_id,
                 progress_id=item_id,
                 fsrs_rating=fsrs_rating,
                 response_time_ms=response_time_ms,
             )
-        if item_type == ItemType.GRAMMAR:
-            return self._complete_grammar_item(
+        elif item_type == ItemType.GRAMMAR:
+            result = self._complete_grammar_item(
                 user_id=user_id,
                 concept_id=item_id,
                 fsrs_rating=fsrs_rating,
             )
-        if item_type == ItemType.ERROR:
-            return self._complete_error_item(
+        elif item_type == ItemType.ERROR:
+            result = self._complete_error_item(
                 user_id=user_id,
                 error_id=item_id,
                 fsrs_rating=fsrs_rating,
             )
-        if item_type == ItemType.CONJUGATION:
-            return self._complete_conjugation_item(
+        elif item_type == ItemType.CONJUGATION:
+            result = self._complete_conjugation_item(
                 user_id=user_id,
                 item_id=item_id,
                 fsrs_rating=fsrs_rating,
                 response_time_ms=response_time_ms,
             )
+        else:
+            raise ValueError(f"Unsupported item type: {item_type}")
 
-        raise ValueError(f"Unsupported item type: {item_type}")
+        cache_backend.invalidate(DUE_SUMMARY_CACHE_NAMESPACE, key=build_cache_key(user_id=str(user_id)))
+        return result
     
+    def _fetch_all_due(
+        self, user_id: UUID, today: date, now: datetime
+    ) -> list[list[tuple[DueLearningItem, MetadataBuilder]]]:
+        """Run the four due-item fetches, concurrently where the database allows."""
+        # Each fetch resolves the target language through the session it runs
+        # on; after the first lookup the user comes from the identity map.
+        fetches = (
+            lambda service: service._fetch_due_vocab(user_id, today, now, service._target_language(user_id)),
+            lambda service: service._fetch_due_grammar(user_id, now, service._target_language(user_id)),
+            lambda service: service._fetch_due_errors(user_id, now),
+            lambda service: service._fetch_due_conjugations(user_id, now),
+        )
+        bind = self.db.get_bind()
+        # SQLite serializes access to one database anyway. Worker sessions
+        # only see committed rows, so a caller with an open transaction (which
+        # may hold flushed but uncommitted writes) or pending changes reads
+        # through its own session; that transaction is never ended here.
+        if (
+            bind.dialect.name in SERIAL_FETCH_DIALECTS
+            or self.db.in_transaction()
+            or self.db.new
+            or self.db.dirty
+            or self.db.deleted
+            or not _fetch_slots.acquire(blocking=False)
+        ):
+            return [fetch(self) for fetch in fetches]
+
+        # Sessions are not thread-safe, so each fetch reads through its own
+        # short-lived session. Nothing here is written, and the loaded rows
+        # stay usable once their session is closed. The caller's session holds
+        # no connection, having no transaction.
+        def run(fetch):  # type: ignore[no-untyped-def]
+            with Session(bind) as session:
+                return fetch(UnifiedSRSService(session))
+
+        try:
+            futures = [_fetch_executor.submit(run, fetch) for fetch in fetches]
+            return [future.result() for future in futures]
+        finally:
+            _fetch_slots.release()
+
     def _fetch_due_vocab(
         self, user_id: UUID, today: date, now: datetime, target_language: str
-    ) -> list[DueLearningItem]:
+    ) -> list[tuple[DueLearningItem, MetadataBuilder]]:
         """Fetch vocabulary items due for review."""
         items = []
         
-        progress_items = (
-            self._due_vocab_query(user_id, today, now, target_language)
+        # Fetches run as lambda statements so repeat calls skip rebuilding
+        # and cache-keying the statement and only bind the new parameters.
+        # Values derived from the arguments are computed outside the lambda,
+        # and the lambda must not close over self.
+        due_filter = vocabulary_due_filter(now)
+        progress_items = self.db.execute(lambda_stmt(
+            lambda: UnifiedSRSService._due_vocab_query(user_id, due_filter, target_language)
             .order_by(
                 UserVocabularyProgress.due_at.asc().nullsfirst(),
                 UserVocabularyProgress.next_review_date.asc().nullsfirst(),
                 UserVocabularyProgress.due_date.asc().nullsfirst(),
                 desc(UserVocabularyProgress.lapses),
             )
-            .limit(100)
-            .all()
-        )
+            .limit(VOCAB_FETCH_LIMIT)
+        )).all()
         
+        now_ts = now.timestamp()
         for progress, word in progress_items:
-            due_since = self._due_since_days(self._vocab_due_at(progress, now), now)
-            translation = word.german_translation or word.english_translation or ""
-            topic_tags = set(word.topic_tags or [])
-            is_mission_phrase = "mission_phrase" in topic_tags
+            due_since = self._due_since_days(self._vocab_due_at(progress, now), now_ts)
+            is_mission_phrase = "mission_phrase" in (word.topic_tags or ())
             
-            items.append(DueLearningItem(
+            items.append((DueLearningItem(
                 id=f"vocab_{progress.id}",
                 item_type=ItemType.VOCAB,
                 priority_score=0,  # Calculated later
@@ -307,26 +454,33 @@ class UnifiedSRSService:
                 due_since_days=due_since,
                 estimated_seconds=TIME_ESTIMATES[ItemType.VOCAB],
                 original_id=progress.id,
-                metadata={
-                    "word_id": word.id,
-                    "stability": progress.stability or 0,
-                    "difficulty": progress.difficulty or 5,
-                    "lapses": progress.lapses or 0,
-                    "direction": word.direction,
-                    "answer": translation,  # Hidden answer for reveal
-                    "part_of_speech": getattr(word, 'part_of_speech', None),
-                    "example_sentence": getattr(word, 'example_sentence', None),
-                    "state": progress.state or "new",
-                    "review_mode": "mission_phrase" if is_mission_phrase else "vocabulary",
-                    "due_at": self._iso(progress.due_at),
-                    "next_review_date": self._iso(progress.next_review_date),
-                    "due_date": progress.due_date.isoformat() if progress.due_date else None,
-                    "route": "/daily-practice?focus=mission" if is_mission_phrase else f"/vocabulary?word={word.id}",
-                }
-            ))
+                stability=progress.stability or 0,
+                lapses=progress.lapses or 0,
+            ), partial(self._vocab_metadata, progress, word, is_mission_phrase)))
         
         return items
 
+    @classmethod
+    def _vocab_metadata(
+        cls, progress: UserVocabularyProgress, word: VocabularyWord, is_mission_phrase: bool
+    ) -> dict[str, Any]:
+        return {
+            "word_id": word.id,
+            "stability": progress.stability or 0,
+            "difficulty": progress.difficulty or 5,
+            "lapses": progress.lapses or 0,
+            "direction": word.direction,
+            "answer": word.german_translation or word.english_translation or "",  # Hidden answer for reveal
+            "part_of_speech": getattr(word, 'part_of_speech', None),
+            "example_sentence": getattr(word, 'example_sentence', None),
+            "state": progress.state or "new",
+            "review_mode": "mission_phrase" if is_mission_phrase else "vocabulary",
+            "due_at": cls._iso(progress.due_at),
+            "next_review_date": cls._iso(progress.next_review_date),
+            "due_date": progress.due_date.isoformat() if progress.due_date else None,
+            "route": "/daily-practice?focus=mission" if is_mission_phrase else f"/vocabulary?word={word.id}",
+        }
+
     def _complete_vocab_item(
         self,
         *,
@@ -336,7 +490,7 @@ class UnifiedSRSService:
         response_time_ms: int | None = None,
     ) -> dict[str, Any]:
         """Complete a vocabulary review via the configured scheduler."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         user = self.db.get(User, user_id)
         if not user:
             raise ValueError("User not found")
@@ -345,18 +499,20 @@ class UnifiedSRSService:
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Invalid vocabulary progress id: {progress_id}") from exc
 
-        progress = (
-            self.db.query(UserVocabularyProgress)
-            .filter(
+        # The word is joined in rather than lazy-loaded on first access
+        progress = self.db.scalars(
+            select(UserVocabularyProgress)
+            .options(joinedload(UserVocabularyProgress.word))
+            .where(
                 UserVocabularyProgress.id == progress_uuid,
                 UserVocabularyProgress.user_id == user_id,
             )
-            .first()
-        )
+        ).first()
         if not progress:
             raise ValueError(f"Vocabulary progress {progress_id} not found")
         if not progress.word:
             raise ValueError(f"Vocabulary word missing for progress {progress_id}")
+        word_text = progress.word.word
 
         srs_service = EnhancedSRSService(self.db)
         srs_service.process_review(
@@ -366,15 +522,17 @@ class UnifiedSRSService:
             now=now,
         )
         progress.updated_at = now
+        # Everything returned was set by the review above, so read it before
+        # the commit instead of reloading the row afterwards
+        next_review = progress.due_at or progress.next_review_date
+        state = progress.state
         self.db.commit()
-        self.db.refresh(progress)
 
-        next_review = progress.due_at or progress.next_review_date
         next_review_days = (next_review.date() - now.date()).days if next_review else None
         return {
             "next_review_days": next_review_days,
-            "state": progress.state,
-            "message": f"Reviewed vocabulary: {progress.word.word}",
+            "state": state,
+            "message": f"Reviewed vocabulary: {word_text}",
         }
 
     def _complete_grammar_item(
@@ -385,7 +543,7 @@ class UnifiedSRSService:
         fsrs_rating: int,
     ) -> dict[str, Any]:
         """Complete a grammar review by mapping rating to grammar score."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         user = self.db.get(User, user_id)
         if not user:
             raise ValueError("User not found")
@@ -400,11 +558,10 @@ class UnifiedSRSService:
         if not concept:
             raise ValueError(f"Grammar concept {concept_id_int} not found")
 
-        score_map = {0: 1.0, 1: 4.0, 2: 7.0, 3: 9.5}
         progress = grammar_service.record_review(
             user=user,
             concept_id=concept_id_int,
-            score=score_map[fsrs_rating],
+            score=GRAMMAR_REVIEW_SCORES[fsrs_rating],
             notes="daily_practice",
         )
 
@@ -424,19 +581,17 @@ class UnifiedSRSService:
         fsrs_rating: int,
     ) -> dict[str, Any]:
         """Complete an error-recall review and update the error SRS fields."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         try:
             error_uuid = UUID(error_id)
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Invalid error id: {error_id}") from exc
-        error = (
-            self.db.query(UserError)
-            .filter(
+        error = self.db.scalars(
+            select(UserError).where(
                 UserError.id == error_uuid,
                 UserError.user_id == user_id,
             )
-            .first()
-        )
+        ).first()
         if not error:
             raise ValueError(f"Error item {error_id} not found")
 
@@ -490,12 +645,13 @@ class UnifiedSRSService:
                 now=now,
             )
 
+        state = error.state
+        message = f"Reviewed error: {error.error_category}"
         self.db.commit()
-        self.db.refresh(error)
         return {
             "next_review_days": next_interval,
-            "state": error.state,
-            "message": f"Reviewed error: {error.error_category}",
+            "state": state,
+            "message": message,
         }
 
     def _complete_conjugation_item(
@@ -508,21 +664,20 @@ class UnifiedSRSService:
     ) -> dict[str, Any]:
         """Complete an irregular conjugation review."""
 
+        now = datetime.now(UTC)
         user = self.db.get(User, user_id)
         if not user:
             raise ValueError("User not found")
         normalized, separator, tense = item_id.partition(":")
         if not separator:
             raise ValueError(f"Invalid conjugation item id: {item_id}")
-        progress = (
-            self.db.query(UserConjugationProgress)
-            .filter(
+        progress = self.db.scalars(
+            select(UserConjugationProgress).where(
                 UserConjugationProgress.user_id == user_id,
                 UserConjugationProgress.normalized_lemma == normalized,
                 UserConjugationProgress.tense == tense,
             )
-            .first()
-        )
+        ).first()
         lemma = progress.verb_lemma if progress else normalized
         updated = ConjugationService(self.db).review(
             user=user,
@@ -532,7 +687,7 @@ class UnifiedSRSService:
             response_time_ms=response_time_ms,
         )
         next_review = updated.next_review_date
-        next_review_days = (next_review.date() - datetime.now(timezone.utc).date()).days if next_review else None
+        next_review_days = (next_review.date() - now.date()).days if next_review else None
         return {
             "next_review_days": next_review_days,
             "state": updated.state,
@@ -541,26 +696,26 @@ class UnifiedSRSService:
     
     def _fetch_due_grammar(
         self, user_id: UUID, now: datetime, target_language: str
-    ) -> list[DueLearningItem]:
+    ) -> list[tuple[DueLearningItem, MetadataBuilder]]:
         """Fetch grammar concepts due for review."""
         items = []
         
-        progress_items = (
-            self._due_grammar_query(user_id, now, target_language)
+        progress_items = self.db.execute(lambda_stmt(
+            lambda: UnifiedSRSService._due_grammar_query(user_id, now, target_language)
             .order_by(
                 UserGrammarProgress.next_review.asc().nullsfirst(),
                 UserGrammarProgress.score.asc(),
                 UserGrammarProgress.reps.asc(),
                 GrammarConcept.difficulty_order.asc(),
             )
-            .limit(50)
-            .all()
-        )
+            .limit(GRAMMAR_FETCH_LIMIT)
+        )).all()
         
+        now_ts = now.timestamp()
         for progress, concept in progress_items:
-            due_since = self._due_since_days(progress.next_review, now)
+            due_since = self._due_since_days(progress.next_review, now_ts)
             
-            items.append(DueLearningItem(
+            items.append((DueLearningItem(
                 id=f"grammar_{concept.id}",
                 item_type=ItemType.GRAMMAR,
                 priority_score=0,
@@ -570,41 +725,45 @@ class UnifiedSRSService:
                 due_since_days=due_since,
                 estimated_seconds=TIME_ESTIMATES[ItemType.GRAMMAR],
                 original_id=concept.id,
-                metadata={
-                    "concept_id": concept.id,
-                    "external_id": concept.external_id,
-                    "category": concept.category,
-                    "subskill": concept.subskill,
-                    "score": progress.score,
-                    "state": progress.state,
-                    "reps": progress.reps,
-                    "review_mode": "grammar",
-                    "next_review": self._iso(progress.next_review),
-                    "route": f"/grammar?concept={concept.id}",
-                }
-            ))
+                metadata={"score": progress.score}
+            ), partial(self._grammar_metadata, progress, concept)))
         
         return items
+
+    @classmethod
+    def _grammar_metadata(cls, progress: UserGrammarProgress, concept: GrammarConcept) -> dict[str, Any]:
+        return {
+            "concept_id": concept.id,
+            "external_id": concept.external_id,
+            "category": concept.category,
+            "subskill": concept.subskill,
+            "score": progress.score,
+            "state": progress.state,
+            "reps": progress.reps,
+            "review_mode": "grammar",
+            "next_review": cls._iso(progress.next_review),
+            "route": f"/grammar?concept={concept.id}",
+        }
     
     def _fetch_due_errors(
         self, user_id: UUID, now: datetime
-    ) -> list[DueLearningItem]:
+    ) -> list[tuple[DueLearningItem, MetadataBuilder]]:
         """Fetch conversation errors due for review."""
         items = []
         
-        errors = (
-            self._due_error_query(user_id, now)
+        errors = self.db.scalars(lambda_stmt(
+            lambda: UnifiedSRSService._due_error_query(user_id, now)
             .order_by(
                 UserError.lapses.desc(),
                 UserError.occurrences.desc(),
                 UserError.next_review_date.asc().nullsfirst(),
             )
-            .limit(30)
-            .all()
-        )
+            .limit(ERROR_FETCH_LIMIT)
+        )).all()
         
+        now_ts = now.timestamp()
         for error in errors:
-            due_since = self._due_since_days(error.next_review_date, now)
+            due_since = self._due_since_days(error.next_review_date, now_ts)
             
             display_title = error.display_label or error.error_pattern or error.original_text or "Language repair"
             
@@ -613,7 +772,7 @@ class UnifiedSRSService:
             display_subtitle = f"{source_label} · {review_mode.replace('_', ' ')}"
             severity = self._error_severity(error)
             
-            items.append(DueLearningItem(
+            items.append((DueLearningItem(
                 id=f"error_{error.id}",
                 item_type=ItemType.ERROR,
                 priority_score=0,
@@ -623,58 +782,73 @@ class UnifiedSRSService:
                 due_since_days=due_since,
                 estimated_seconds=TIME_ESTIMATES[ItemType.ERROR],
                 original_id=error.id,
-                metadata={
-                    "concept_id": error.concept_id,
-                    "linked_word_id": error.linked_word_id,
-                    "stability": error.stability or 0,
-                    "difficulty": error.difficulty or 5,
-                    "lapses": error.lapses or 0,
-                    "occurrences": error.occurrences or 1,
-                    "severity": severity,
-                    "original_text": error.original_text,
-                    "correction": error.correction,
-                    "context": error.context_snippet,
-                    "why_wrong": error.why_wrong,
-                    "repair_hint": error.repair_hint,
-                    "display_label": error.display_label,
-                    "task_error_type": error.task_error_type,
-                    "error_category": error.error_category,
-                    "subcategory": error.subcategory,
-                    "review_mode": review_mode,
-                    "source_type": error.source_type,
-                    "source_label": source_label,
-                    "next_review_date": self._iso(error.next_review_date),
-                    "route": (
-                        f"/grammar?concept={error.concept_id}"
-                        if error.concept_id
-                        else "/atelier"
-                    ),
-                }
-            ))
+                metadata={"severity": severity},
+                stability=error.stability or 0,
+                lapses=error.lapses or 0,
+            ), partial(self._error_metadata, error, severity, review_mode, source_label)))
         
         return items
 
-    def _fetch_due_conjugations(self, user_id: UUID, now: datetime) -> list[DueLearningItem]:
+    @classmethod
+    def _error_metadata(
+        cls, error: UserError, severity: int, review_mode: str, source_label: str
+    ) -> dict[str, Any]:
+        return {
+            "concept_id": error.concept_id,
+            "linked_word_id": error.linked_word_id,
+            "stability": error.stability or 0,
+            "difficulty": error.difficulty or 5,
+            "lapses": error.lapses or 0,
+            "occurrences": error.occurrences or 1,
+            "severity": severity,
+            "original_text": error.original_text,
+            "correction": error.correction,
+            "context": error.context_snippet,
+            "why_wrong": error.why_wrong,
+            "repair_hint": error.repair_hint,
+            "display_label": error.display_label,
+            "task_error_type": error.task_error_type,
+            "error_category": error.error_category,
+            "subcategory": error.subcategory,
+            "review_mode": review_mode,
+            "source_type": error.source_type,
+            "source_label": source_label,
+            "next_review_date": cls._iso(error.next_review_date),
+            "route": (
+                f"/grammar?concept={error.concept_id}"
+                if error.concept_id
+                else "/atelier"
+            ),
+        }
+
+    def _fetch_due_conjugations(
+        self, user_id: UUID, now: datetime
+    ) -> list[tuple[DueLearningItem, MetadataBuilder]]:
         """Fetch irregular conjugation SRS items due for review."""
 
-        items: list[DueLearningItem] = []
-        rows = (
-            self._due_conjugation_query(user_id, now)
+        items: list[tuple[DueLearningItem, MetadataBuilder]] = []
+        today = now.date()
+        rows = self.db.scalars(lambda_stmt(
+            lambda: UnifiedSRSService._due_conjugation_query(user_id, now, today)
             .order_by(
                 UserConjugationProgress.next_review_date.asc().nullsfirst(),
                 UserConjugationProgress.due_date.asc().nullsfirst(),
                 UserConjugationProgress.lapses.desc(),
             )
-            .limit(40)
-            .all()
-        )
+            .limit(CONJUGATION_FETCH_LIMIT)
+        )).all()
+        now_ts = now.timestamp()
+        today_ordinal = today.toordinal()
         for progress in rows:
-            due_at = progress.next_review_date
-            if due_at is None and progress.due_date:
-                due_at = datetime.combine(progress.due_date, time.min, tzinfo=timezone.utc)
-            due_since = self._due_since_days(due_at or now, now)
+            if progress.next_review_date is not None:
+                due_since = self._due_since_days(progress.next_review_date, now_ts)
+            elif progress.due_date:
+                # Date-only schedules fall due at midnight UTC
+                due_since = max(0, today_ordinal - progress.due_date.toordinal())
+            else:
+                due_since = 0
             tense_label = DISPLAY_TENSES.get(progress.tense, progress.tense)
-            items.append(
+            items.append((
                 DueLearningItem(
                     id=f"conjugation_{progress.normalized_lemma}:{progress.tense}",
                     item_type=ItemType.CONJUGATION,
@@ -685,25 +859,31 @@ class UnifiedSRSService:
                     due_since_days=due_since,
                     estimated_seconds=TIME_ESTIMATES[ItemType.CONJUGATION],
                     original_id=f"{progress.normalized_lemma}:{progress.tense}",
-                    metadata={
-                        "lemma": progress.verb_lemma,
-                        "normalized_lemma": progress.normalized_lemma,
-                        "tense": progress.tense,
-                        "tense_label": tense_label,
-                        "stability": progress.stability or 0,
-                        "difficulty": progress.difficulty or 5,
-                        "lapses": progress.lapses or 0,
-                        "state": progress.state or "new",
-                        "review_mode": "conjugation",
-                        "route": "/vocabulary/conjugation",
-                    },
-                )
-            )
+                    stability=progress.stability or 0,
+                    lapses=progress.lapses or 0,
+                ),
+                partial(self._conjugation_metadata, progress, tense_label),
+            ))
         return items
+
+    @staticmethod
+    def _conjugation_metadata(progress: UserConjugationProgress, tense_label: str) -> dict[str, Any]:
+        return {
+            "lemma": progress.verb_lemma,
+            "normalized_lemma": progress.normalized_lemma,
+            "tense": progress.tense,
+            "tense_label": tense_label,
+            "stability": progress.stability or 0,
+            "difficulty": progress.difficulty or 5,
+            "lapses": progress.lapses or 0,
+            "state": progress.state or "new",
+            "review_mode": "conjugation",
+            "route": "/vocabulary/conjugation",
+        }
     
-    def _calculate_priority(self, item: DueLearningItem) -> float:
+    def _calculate_priorities(self, items: list[DueLearningItem]) -> np.ndarray:
         """
-        Calculate priority score (0-100).
+        Calculate priority scores (0-100) for all items at once.
         
         Formula:
         priority = base_type_priority + overdue_bonus + fragility_bonus
@@ -712,30 +892,39 @@ class UnifiedSRSService:
         - Overdue: +3 points per day overdue
         - Fragility: low stability = higher priority
         """
-        base = BASE_PRIORITY.get(item.item_type, 10)
+        type_codes = np.fromiter(
+            (ITEM_TYPE_CODES[item.item_type] for item in items), dtype=np.intp, count=len(items)
+        )
+        base = BASE_PRIORITY_BY_CODE[type_codes]
+        due_since = np.array([item.due_since_days for item in items], dtype=float)
+        stability = np.array([item.stability for item in items], dtype=float)
+        lapses = np.array([item.lapses for item in items], dtype=float)
+        is_grammar = type_codes == ITEM_TYPE_CODES[ItemType.GRAMMAR]
+        is_error = type_codes == ITEM_TYPE_CODES[ItemType.ERROR]
+        grammar_score = np.array(
+            [float(item.metadata.get("score") or 0) if grammar else 0.0 for item, grammar in zip(items, is_grammar, strict=True)],
+            dtype=float,
+        )
+        severity = np.array(
+            [int(item.metadata.get("severity") or 0) if error else 0 for item, error in zip(items, is_error, strict=True)],
+            dtype=float,
+        )
         
         # Overdue bonus: +3 per day, capped at +30
-        overdue_bonus = min(item.due_since_days * 3, 30) if item.due_since_days > 0 else 0
+        overdue_bonus = np.minimum(np.maximum(due_since, 0) * 3, 30)
         
-        # Fragility bonus based on stability (lower = more fragile = higher priority)
-        stability = item.metadata.get("stability", 0)
-        if stability > 0:
-            fragility_bonus = max(0, 20 - stability)  # 0-20 points
-        else:
-            fragility_bonus = 10  # New items get medium boost
+        # Fragility bonus based on stability (lower = more fragile = higher priority);
+        # new items get a medium boost
+        fragility_bonus = np.where(stability > 0, np.maximum(0, 20 - stability), 10)
+        fragility_bonus = np.where(
+            is_grammar, np.maximum(fragility_bonus, (10 - grammar_score) * 2), fragility_bonus
+        )
         
-        if item.item_type == ItemType.GRAMMAR:
-            score = float(item.metadata.get("score") or 0)
-            fragility_bonus = max(fragility_bonus, (10 - score) * 2)
-
-        severity_bonus = 0
-        if item.item_type == ItemType.ERROR:
-            severity_bonus = min(int(item.metadata.get("severity") or 0) * 3, 12)
-
-        lapse_bonus = min(item.metadata.get("lapses", 0) * 2, 10)
+        severity_bonus = np.minimum(severity * 3, 12)
+        lapse_bonus = np.minimum(lapses * 2, 10)
         
         priority = base + overdue_bonus + fragility_bonus + lapse_bonus + severity_bonus
-        return min(priority, 100)  # Cap at 100
+        return np.minimum(priority, 100)  # Cap at 100
     
     def _interleave_random(self, items: list[DueLearningItem]) -> list[DueLearningItem]:
         """
@@ -747,18 +936,19 @@ class UnifiedSRSService:
         - Preventing blocked repetition fatigue
         """
         # Group by type
-        by_type: dict[ItemType, list[DueLearningItem]] = {t: [] for t in ItemType}
+        by_type: dict[ItemType, deque[DueLearningItem]] = {t: deque() for t in ItemType}
         for item in items:
             by_type[item.item_type].append(item)
         
         # Build interleaved queue
         result = []
-        type_cycle = [ItemType.ERROR, ItemType.GRAMMAR, ItemType.CONJUGATION, ItemType.VOCAB]
+        remaining = len(items)
         
-        while any(by_type.values()):
-            for item_type in type_cycle:
+        while remaining:
+            for item_type in INTERLEAVE_ORDER:
                 if by_type[item_type]:
-                    result.append(by_type[item_type].pop(0))
+                    result.append(by_type[item_type].popleft())
+                    remaining -= 1
         
         return result
     
@@ -766,15 +956,11 @@ class UnifiedSRSService:
         self, items: list[DueLearningItem], budget_seconds: int
     ) -> list[DueLearningItem]:
         """Filter queue to fit within time budget."""
-        result = []
-        total_time = 0
-        
-        for item in items:
-            if total_time + item.estimated_seconds <= budget_seconds:
-                result.append(item)
-                total_time += item.estimated_seconds
-            else:
-                break  # Stop when budget exceeded
+        # Keep the longest prefix whose running total fits; the queue stops
+        # at the first item that would exceed the budget
+        times = np.fromiter((item.estimated_seconds for item in items), dtype=np.int64, count=len(items))
+        cutoff = int(np.searchsorted(np.cumsum(times), budget_seconds, side="right"))
+        result = items[:cutoff]
         
         logger.info(f"Applied time budget: {len(result)}/{len(items)} items fit in {budget_seconds}s")
         return result
@@ -785,28 +971,28 @@ class UnifiedSRSService:
             return "fr"
         return (user.target_language or "fr").strip() or "fr"
 
+    @staticmethod
     def _due_vocab_query(
-        self,
         user_id: UUID,
-        today: date,
-        now: datetime,
+        due_filter: ColumnElement[bool],
         target_language: str,
     ):
         return (
-            self.db.query(UserVocabularyProgress, VocabularyWord)
+            select(UserVocabularyProgress, VocabularyWord)
             .join(VocabularyWord, UserVocabularyProgress.word_id == VocabularyWord.id)
-            .filter(
+            .where(
                 UserVocabularyProgress.user_id == user_id,
                 VocabularyWord.language == target_language,
-                vocabulary_due_filter(now),
+                due_filter,
             )
         )
 
-    def _due_grammar_query(self, user_id: UUID, now: datetime, target_language: str):
+    @staticmethod
+    def _due_grammar_query(user_id: UUID, now: datetime, target_language: str):
         return (
-            self.db.query(UserGrammarProgress, GrammarConcept)
+            select(UserGrammarProgress, GrammarConcept)
             .join(GrammarConcept, UserGrammarProgress.concept_id == GrammarConcept.id)
-            .filter(
+            .where(
                 UserGrammarProgress.user_id == user_id,
                 GrammarConcept.active.is_(True),
                 GrammarConcept.language == target_language,
@@ -814,18 +1000,16 @@ class UnifiedSRSService:
                     UserGrammarProgress.state.is_(None),
                     not_(UserGrammarProgress.state.in_(MASTERED_STATES)),
                 ),
-                or_(
-                    UserGrammarProgress.next_review <= now,
-                    UserGrammarProgress.next_review.is_(None),
-                ),
+                func.coalesce(UserGrammarProgress.next_review, NEVER_REVIEWED) <= now,
             )
         )
 
-    def _due_error_query(self, user_id: UUID, now: datetime):
-        return self.db.query(UserError).filter(
+    @staticmethod
+    def _due_error_query(user_id: UUID, now: datetime):
+        return select(UserError).where(
             UserError.user_id == user_id,
             or_(UserError.state.is_(None), not_(UserError.state.in_(MASTERED_STATES))),
-            or_(UserError.next_review_date <= now, UserError.next_review_date.is_(None)),
+            func.coalesce(UserError.next_review_date, NEVER_REVIEWED) <= now,
             or_(
                 UserError.task_error_type.is_(None),
                 UserError.task_error_type != TASK_COMPLIANCE,
@@ -834,9 +1018,9 @@ class UnifiedSRSService:
             ),
         )
 
-    def _due_conjugation_query(self, user_id: UUID, now: datetime):
-        today = now.date()
-        return self.db.query(UserConjugationProgress).filter(
+    @staticmethod
+    def _due_conjugation_query(user_id: UUID, now: datetime, today: date):
+        return select(UserConjugationProgress).where(
             UserConjugationProgress.user_id == user_id,
             or_(UserConjugationProgress.state.is_(None), not_(UserConjugationProgress.state.in_(MASTERED_STATES))),
             or_(
@@ -854,12 +1038,12 @@ class UnifiedSRSService:
         return vocabulary_progress_due_at(progress) or now
 
     @staticmethod
-    def _due_since_days(due_at: datetime | None, now: datetime) -> int:
+    def _due_since_days(due_at: datetime | None, now_ts: float) -> int:
         if due_at is None:
             return 0
         if due_at.tzinfo is None:
-            due_at = due_at.replace(tzinfo=timezone.utc)
-        return max(0, (now - due_at).days)
+            due_at = due_at.replace(tzinfo=UTC)
+        return max(0, int((now_ts - due_at.timestamp()) // 86400))
 
     @staticmethod
     def _iso(value: datetime | None) -> str | None:
@@ -892,11 +1076,10 @@ class UnifiedSRSService:
         concept = self.db.get(GrammarConcept, concept_id)
         if not concept or not concept.active:
             return
-        score_map = {0: 2.0, 1: 4.0, 2: 7.5, 3: 9.0}
         GrammarService(self.db).record_context_review(
             user=user,
             concept_id=concept_id,
-            score=score_map[fsrs_rating],
+            score=ERROR_GRAMMAR_CREDIT_SCORES[fsrs_rating],
             notes=error.display_label or error.task_error_type or "errata review",
             source="unified_srs",
         )
@@ -11,6 +11,8 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
+import orjson
+
 from app.config import settings
 
 
@@ -28,6 +30,15 @@ def _json_default(value: Any) -> Any:
     raise TypeError(f"Object of type {type(value)!r} is not JSON serializable")
 
 
+# Cached payloads are encoded with orjson; non-string dict keys and numpy
+# scalars are accepted, as ``json`` with ``_json_default`` did.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dumps(value: Any) -> str:
+    return orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS).decode("utf-8")
+
+
 def build_cache_key(**components: Any) -> str:
     """Return a stable hash for the provided components."""
 
@@ -77,7 +88,7 @@ class CacheBackend:
                 self._redis = None
             else:
                 if value is not None:
-                    return json.loads(value)
+                    return orjson.loads(value)
         with self._lock:
             entry = self._local.get(namespaced)
             if not entry:
@@ -85,11 +96,11 @@ class CacheBackend:
             if entry.expires_at is not None and entry.expires_at < time.time():
                 self._local.pop(namespaced, None)
                 return None
-            return json.loads(entry.payload)
+            return orjson.loads(entry.payload)
 
     def set(self, namespace: str, key: str, value: Any, ttl_seconds: int) -> None:
         namespaced = self._compose(namespace, key)
-        payload = json.dumps(value, default=_json_default)
+        payload = _dumps(value)
         if self._redis is not None:
             try:
                 self._redis.set(namespaced, payload, ex=ttl_seconds)
@@ -99,6 +110,24 @@ class CacheBackend:
             expires_at = time.time() + ttl_seconds if ttl_seconds else None
             self._local[namespaced] = _CacheEntry(expires_at=expires_at, payload=payload)
 
+    def incr(self, namespace: str, key: str) -> int:
+        """Increment a counter that never expires and return its new value."""
+        namespaced = self._compose(namespace, key)
+        if self._redis is not None:
+            try:
+                value = int(self._redis.incr(namespaced))
+            except Exception:
+                self._redis = None
+            else:
+                with self._lock:
+                    self._local[namespaced] = _CacheEntry(expires_at=None, payload=str(value))
+                return value
+        with self._lock:
+            entry = self._local.get(namespaced)
+            value = (int(entry.payload) if entry else 0) + 1
+            self._local[namespaced] = _CacheEntry(expires_at=None, payload=str(value))
+            return value
+
     def invalidate(self, namespace: str, *, key: str | None = None, prefix: str | None = None) -> None:
         if key is not None:
             namespaced = self._compose(namespace, key)
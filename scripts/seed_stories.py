@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.db.models.story import Story, Chapter, Scene, StoryProgress
 from app.db.models.npc import NPC
+from app.services.story_service import invalidate_chapter_graph, normalize_narrative_goals
 
 
 STORIES_DIR = project_root / "app" / "data" / "stories"
@@ -74,6 +75,7 @@ def seed_story(db: Session, story_dir: Path) -> None:
             seed_chapter(db, story_id, chapter_file, chapter_order)
     
     db.commit()
+    invalidate_chapter_graph(story_id)
     print(f"  ✓ Story '{story_id}' seeded successfully")
 
 
@@ -121,6 +123,7 @@ def seed_chapter(db: Session, story_id: str, chapter_file: Path, chapter_order:
         title=chapter_data["title"],
         target_level=chapter_data.get("target_level"),
         learning_focus=chapter_data.get("learning_focus", {}),
+        narrative_goals=normalize_narrative_goals(chapter_data.get("narrative_goals")),
         cliffhanger=chapter_data.get("cliffhanger"),
         unlock_conditions=chapter_data.get("unlock_conditions"),
     )
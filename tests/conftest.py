@@ -2,7 +2,8 @@
 
 import asyncio
 import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - import only for static analysis
@@ -19,7 +20,7 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover
     pytest_asyncio = None  # type: ignore[assignment]
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -61,6 +62,7 @@ from app.db.models.graphic_novel import (
 )
 from app.db.models.library import BookEpisode, UserBook
 from app.db.models.mission import RealWorldMission, RealWorldMissionAttempt, RealWorldMissionTurn
+from app.db.models.npc import NPC, NPCRelationship
 from app.db.models.progress import ReviewLog, UserVocabularyProgress
 from app.db.models.push_subscription import PushSubscription
 from app.db.models.serial import SerialEpisode, SerialThread
@@ -70,6 +72,7 @@ from app.db.models.session import (
     SessionLearningMoment,
     WordInteraction,
 )
+from app.db.models.story import Chapter, Scene, SceneImage, Story, StoryProgress
 from app.main import create_app
 from app.utils.cache import cache_backend
 
@@ -132,6 +135,13 @@ def db_engine():
             ConversationMessage.__table__,
             SessionLearningMoment.__table__,
             WordInteraction.__table__,
+            Story.__table__,
+            Chapter.__table__,
+            Scene.__table__,
+            SceneImage.__table__,
+            StoryProgress.__table__,
+            NPC.__table__,
+            NPCRelationship.__table__,
         ],
     )
     try:
@@ -140,6 +150,13 @@ def db_engine():
         Base.metadata.drop_all(
             bind=engine,
             tables=[
+                NPCRelationship.__table__,
+                NPC.__table__,
+                StoryProgress.__table__,
+                SceneImage.__table__,
+                Scene.__table__,
+                Chapter.__table__,
+                Story.__table__,
                 WordInteraction.__table__,
                 SessionLearningMoment.__table__,
                 ConversationMessage.__table__,
@@ -195,6 +212,26 @@ def db_session(db_engine) -> Generator[Session, None, None]:
         db.close()
 
 
+@pytest.fixture()
+def count_statements(db_engine) -> Callable[[], AbstractContextManager[list[str]]]:
+    """Return a context manager collecting the SQL run on the test engine."""
+
+    @contextmanager
+    def _count() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine, "before_cursor_execute", _record)
+
+    return _count
+
+
 @pytest.fixture(autouse=True)
 def clear_cache() -> Generator[None, None, None]:
     cache_backend.clear()
@@ -193,6 +193,35 @@ def test_anki_sync_preserves_future_due_datetime(db_session) -> None:
     assert ProgressService(db_session).count_due_reviews(user.id, now=now) == 0
 
 
+def test_due_context_matches_topic_tags_regardless_of_case_and_spacing(db_session) -> None:
+    user = User(email="topic-tags-case@example.com", hashed_password="x", target_language="fr")
+    word = VocabularyWord(
+        language="fr",
+        word="fromage",
+        normalized_word="fromage",
+        direction="fr_to_de",
+        is_anki_card=True,
+        topic_tags=[" Food ", "food", "Travel", " "],
+    )
+    db_session.add_all([user, word])
+    db_session.flush()
+    db_session.expire(word)
+
+    assert word.topic_tags == ["food", "travel"]
+
+    context = ProgressService(db_session).get_vocabulary_due_context(
+        user=user,
+        due_limit=0,
+        fragile_limit=0,
+        new_limit=0,
+        linked_limit=0,
+        topic_tags=["FOOD "],
+    )
+
+    assert [item["word"] for item in context["topic_compatible_words"]] == ["fromage"]
+    db_session.rollback()
+
+
 def test_future_due_at_later_today_is_not_currently_due_across_srs_surfaces(db_session) -> None:
     user = User(email="future-due-srs@example.com", hashed_password="x", target_language="fr")
     word = VocabularyWord(
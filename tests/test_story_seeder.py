@@ -0,0 +1,37 @@
+"""Tests for the sample story seeder."""
+from __future__ import annotations
+
+from sqlalchemy import func, select
+
+from app.db.models.story import Chapter, Scene, Story
+from app.services.story_seeder import load_story_data, seed_stories
+
+
+def test_seed_stories_creates_a_playable_linked_story(db_session, count_statements) -> None:
+    story_id = load_story_data()["story"]["id"]
+    try:
+        with count_statements() as statements:
+            seed_stories(db_session)
+        seed_stories(db_session)  # Already seeded: no duplicates
+
+        story = db_session.get(Story, story_id)
+        chapters = {chapter.id: chapter for chapter in story.chapters}
+        scene_count = db_session.scalar(
+            select(func.count()).select_from(Scene).where(Scene.chapter_id.in_(chapters))
+        )
+
+        assert len(chapters) == 7
+        assert scene_count == 7
+        assert chapters["cafe_ch1_discovery"].default_next_chapter_id == "cafe_ch2_clues"
+        assert chapters["cafe_ch7_epilogue"].default_next_chapter_id is None
+        assert {choice["next_chapter_id"] for choice in chapters["cafe_ch2_clues"].branching_choices} <= set(chapters)
+        goal = chapters["cafe_ch1_discovery"].narrative_goals[0]
+        assert goal["required_words_normalized"] == ["inquiet", "disparaitre"]
+        # Existence check, one batched insert per table, one executemany link update
+        assert len(statements) == 5
+    finally:
+        chapter_ids = select(Chapter.id).where(Chapter.story_id == story_id)
+        db_session.query(Scene).filter(Scene.chapter_id.in_(chapter_ids)).delete()
+        db_session.query(Chapter).filter(Chapter.story_id == story_id).delete()
+        db_session.query(Story).filter(Story.id == story_id).delete()
+        db_session.commit()
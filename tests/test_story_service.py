@@ -0,0 +1,645 @@
+"""Tests for the interactive story service."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.core.security import decode_token
+from app.db.models.npc import NPC, NPCRelationship
+from app.db.models.session import ConversationMessage, LearningSession
+from app.db.models.story import Chapter, Scene, Story, StoryProgress
+from app.db.models.user import User
+from app.db.models.vocabulary import VocabularyWord
+from app.services.story_service import (
+    GoalCheckResult,
+    StoryService,
+    _json_array_append,
+    invalidate_story_cache,
+    normalize_narrative_goals,
+)
+
+
+def _user(db_session) -> User:
+    user = User(
+        id=uuid4(),
+        email=f"story-{uuid4().hex}@example.com",
+        hashed_password="test",
+        native_language="en",
+        target_language="fr",
+        proficiency_level="A2",
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def _token(client: TestClient) -> str:
+    email = f"story-{uuid4().hex}@example.com"
+    password = "story-secure"
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "password": password, "target_language": "fr", "native_language": "en"},
+    )
+    response = client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    return response.json()["access_token"]
+
+
+@pytest.fixture()
+def story_tree(db_session):
+    suffix = uuid4().hex[:8]
+    story = Story(id=f"story_{suffix}", title=f"Histoire {suffix}", target_levels=["A1"], themes=["voyage"])
+    chapters = [
+        Chapter(
+            id=f"ch{index}_{suffix}",
+            story_id=story.id,
+            order_index=index,
+            title=f"Chapitre {index}",
+            narrative_goals=[],
+        )
+        for index in (1, 2, 3)
+    ]
+    scenes = [
+        Scene(
+            id=f"sc{index}_{suffix}",
+            chapter_id=chapter.id,
+            order_index=1,
+            narration_variants={"A1": f"Scène {index}"},
+            npcs_present=[],
+        )
+        for index, chapter in enumerate(chapters, start=1)
+    ]
+    db_session.add(story)
+    db_session.add_all(chapters)
+    db_session.add_all(scenes)
+    db_session.commit()
+    try:
+        yield story, chapters, scenes
+    finally:
+        db_session.query(StoryProgress).filter(StoryProgress.story_id == story.id).delete()
+        db_session.query(Scene).filter(Scene.chapter_id.in_([c.id for c in chapters])).delete()
+        db_session.query(Chapter).filter(Chapter.story_id == story.id).delete()
+        db_session.query(Story).filter(Story.id == story.id).delete()
+        db_session.commit()
+
+
+def test_list_available_stories_includes_current_chapter_title(db_session, story_tree) -> None:
+    story, chapters, scenes = story_tree
+    user = _user(db_session)
+    db_session.add(
+        StoryProgress(
+            user_id=user.id,
+            story_id=story.id,
+            current_chapter_id=chapters[1].id,
+            current_scene_id=scenes[1].id,
+            completion_percentage=33,
+            status="in_progress",
+        )
+    )
+    db_session.commit()
+
+    items = {item.id: item for item in StoryService(db_session).list_available_stories(user)}
+
+    assert items[story.id].progress is not None
+    assert items[story.id].progress.current_chapter_title == "Chapitre 2"
+    assert items[story.id].progress.completion_percentage == 33
+
+
+def test_list_available_stories_without_progress(db_session, story_tree) -> None:
+    story, _, _ = story_tree
+    user = _user(db_session)
+
+    items = {item.id: item for item in StoryService(db_session).list_available_stories(user)}
+
+    assert items[story.id].progress is None
+    assert items[story.id].themes == ["voyage"]
+
+
+def test_check_narrative_goals_matches_inflected_forms(db_session, story_tree) -> None:
+    _, chapters, _ = story_tree
+    user = _user(db_session)
+    session = LearningSession(user_id=user.id, planned_duration_minutes=10)
+    db_session.add(session)
+    db_session.flush()
+    for index, content in enumerate(["J'ai cherché mes amis.", "Le chat a disparu, tout de suite !"], start=1):
+        db_session.add(ConversationMessage(session_id=session.id, sender="user", content=content, sequence_number=index))
+    db_session.commit()
+
+    chapter = chapters[0]
+    goals = [
+        {"goal_id": "search", "required_words": ["chercher", "ami"], "min_required": 2},
+        {"goal_id": "vanish", "required_words": ["disparaître"]},
+        {"goal_id": "phrase", "required_words": ["tout de suite"]},
+        {"goal_id": "missing", "required_words": ["boulangerie", "croissant"]},
+    ]
+
+    # Stored goals with pre-normalized words and legacy goals must agree
+    for narrative_goals in (goals, normalize_narrative_goals(goals)):
+        chapter.narrative_goals = narrative_goals
+        result = StoryService(db_session).check_narrative_goals(session.id, chapter)
+
+        assert result.goals_completed == ["search", "vanish", "phrase"]
+        assert result.goals_remaining == ["missing"]
+
+
+def test_check_narrative_goals_matches_words_inside_longer_words(db_session, story_tree) -> None:
+    _, chapters, _ = story_tree
+    user = _user(db_session)
+    session = LearningSession(user_id=user.id, planned_duration_minutes=10)
+    db_session.add(session)
+    db_session.flush()
+    db_session.add(
+        ConversationMessage(
+            session_id=session.id, sender="user", content="Il veut devenir chauffeur de camion.", sequence_number=1
+        )
+    )
+    db_session.commit()
+
+    chapter = chapters[0]
+    chapter.narrative_goals = normalize_narrative_goals(
+        [
+            {"goal_id": "come", "required_words": ["venir"]},
+            {"goal_id": "friend", "required_words": ["ami"]},
+            {"goal_id": "bread", "required_words": ["pain"]},
+        ]
+    )
+    result = StoryService(db_session).check_narrative_goals(session.id, chapter)
+
+    # Required words are matched as substrings of the transcript, not only at
+    # the start of a word
+    assert result.goals_completed == ["come", "friend"]
+    assert result.goals_remaining == ["bread"]
+
+
+def test_normalize_narrative_goals_strips_case_and_accents() -> None:
+    goals = normalize_narrative_goals([{"goal_id": "g", "required_words": ["Disparaître", "métro"]}])
+
+    assert goals == [
+        {
+            "goal_id": "g",
+            "required_words": ["Disparaître", "métro"],
+            "required_words_normalized": ["disparaitre", "metro"],
+            "required_stems": ["disparait", "metro"],
+        }
+    ]
+    assert normalize_narrative_goals(None) == []
+
+
+def test_story_chapters_endpoint_reports_lock_and_completion(client: TestClient, db_session, story_tree) -> None:
+    story, chapters, scenes = story_tree
+    token = _token(client)
+    user_id = UUID(str(decode_token(token)["sub"]))
+    db_session.add(
+        StoryProgress(
+            user_id=user_id,
+            story_id=story.id,
+            current_chapter_id=chapters[1].id,
+            current_scene_id=scenes[1].id,
+            chapters_completed=[chapters[0].id],
+            chapters_completed_details=[{"chapter_id": chapters[0].id, "was_perfect": True}],
+            perfect_chapter_ids=[chapters[0].id],
+            status="in_progress",
+        )
+    )
+    db_session.commit()
+
+    response = client.get(f"/api/v1/stories/{story.id}/chapters", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["id"] for item in payload] == [chapter.id for chapter in chapters]
+    assert [(item["is_completed"], item["was_perfect"], item["is_locked"]) for item in payload] == [
+        (True, True, False),
+        (False, False, False),
+        (False, False, True),
+    ]
+
+
+def test_get_chapter_vocabulary_skips_repeated_entries(db_session, story_tree) -> None:
+    _, chapters, _ = story_tree
+    suffix = uuid4().hex[:8]
+    word = VocabularyWord(
+        language="fr",
+        word=f"indice{suffix}",
+        normalized_word=f"indice{suffix}",
+        english_translation="clue",
+        difficulty_level=1,
+    )
+    db_session.add(word)
+    db_session.commit()
+    chapter = chapters[0]
+    chapter.learning_focus = {
+        "vocabulary": [word.word, {"word": word.word.upper(), "translation": "hint"}, "inconnu"],
+    }
+
+    vocabulary = StoryService(db_session).get_chapter_vocabulary(chapter)
+
+    assert [(item["id"], item["word"], item["translation"]) for item in vocabulary] == [
+        (word.id, word.word, "clue"),
+        (None, "inconnu", None),
+    ]
+
+
+def test_list_available_stories_is_cached_until_progress_changes(db_session, story_tree) -> None:
+    story, _, _ = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+
+    assert {item.id: item for item in service.list_available_stories(user)}[story.id].progress is None
+
+    service.start_story(user, story.id)
+    items = {item.id: item for item in service.list_available_stories(user)}
+
+    assert items[story.id].progress is not None
+    assert items[story.id].progress.current_chapter_title == "Chapitre 1"
+
+    # Served from the cache: the chapter rename is not visible until a write
+    story.chapters[0].title = "Renamed"
+    db_session.commit()
+    cached = {item.id: item for item in service.list_available_stories(user)}
+    assert cached[story.id].progress.current_chapter_title == "Chapitre 1"
+    assert cached[story.id].progress.last_played_at == items[story.id].progress.last_played_at
+
+    # A progress write bumps the learner's cache version instead of scanning keys
+    invalidate_story_cache(user.id)
+    refreshed = {item.id: item for item in service.list_available_stories(user)}
+    assert refreshed[story.id].progress.current_chapter_title == "Renamed"
+
+
+def test_complete_chapter_with_goals_advances_to_next_chapter(db_session, story_tree) -> None:
+    story, chapters, scenes = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+    chapters[0].completion_xp = 50
+    chapters[0].perfect_completion_xp = 120
+    chapters[0].default_next_chapter_id = chapters[2].id
+    db_session.commit()
+
+    reward = service.complete_chapter_with_goals(
+        user,
+        chapters[0].id,
+        uuid4(),
+        GoalCheckResult(goals_completed=["a"], goals_remaining=[], completion_rate=1.0),
+    )
+
+    progress = service.get_story_progress(user, story.id)
+    assert reward.is_perfect is True
+    assert reward.xp_earned == 120
+    assert reward.next_chapter.id == chapters[2].id
+    assert progress.current_chapter_id == chapters[2].id
+    assert progress.current_scene_id == scenes[2].id
+    assert progress.completion_percentage == 33
+    assert progress.chapters_completed == [chapters[0].id]
+    assert progress.total_xp_earned == 120
+    assert user.total_xp == 120
+    assert progress.perfect_chapters_count == 1
+    assert progress.perfect_chapter_ids == [chapters[0].id]
+    assert [detail["chapter_id"] for detail in progress.chapters_completed_details] == [chapters[0].id]
+    assert progress.chapters_completed_details[0]["was_perfect"] is True
+
+
+def test_complete_chapter_with_goals_appends_each_attempt(db_session, story_tree) -> None:
+    story, chapters, _ = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+    chapters[0].completion_xp = 40
+    db_session.commit()
+    partial = GoalCheckResult(goals_completed=[], goals_remaining=["a"], completion_rate=0.0)
+
+    service.complete_chapter_with_goals(user, chapters[0].id, uuid4(), partial)
+    service.complete_chapter_with_goals(user, chapters[0].id, uuid4(), partial)
+
+    progress = service.get_story_progress(user, story.id)
+    assert progress.chapters_completed == [chapters[0].id]
+    assert len(progress.chapters_completed_details) == 2
+    assert progress.total_xp_earned == 80
+    assert progress.completion_percentage == 33
+
+
+def test_complete_chapter_with_goals_stamps_final_chapter_once(db_session, story_tree) -> None:
+    story, chapters, _ = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+    result = GoalCheckResult(goals_completed=[], goals_remaining=[], completion_rate=0.0)
+
+    reward = service.complete_chapter_with_goals(user, chapters[2].id, uuid4(), result)
+
+    progress = service.get_story_progress(user, story.id)
+    assert reward.story_completed is True
+    assert progress.completed_at == progress.last_played_at
+
+
+def test_complete_chapter_with_goals_updates_progress_once(db_session, story_tree, count_statements) -> None:
+    story, chapters, _ = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+    db_session.refresh(user)
+    result = GoalCheckResult(goals_completed=[], goals_remaining=[], completion_rate=0.0)
+
+    with count_statements() as statements:
+        service.complete_chapter_with_goals(user, chapters[0].id, uuid4(), result)
+
+    progress_updates = [
+        statement for statement in statements if statement.lstrip().upper().startswith("UPDATE STORY_PROGRESS")
+    ]
+    assert len(progress_updates) == 1
+    progress = service.get_story_progress(user, story.id)
+    assert progress.current_chapter_id == chapters[1].id
+    assert progress.completion_percentage == 33
+
+
+def test_complete_chapter_with_goals_requires_progress(db_session, story_tree) -> None:
+    _, chapters, _ = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    result = GoalCheckResult(goals_completed=[], goals_remaining=[], completion_rate=0.0)
+
+    with pytest.raises(ValueError, match="no progress"):
+        service.complete_chapter_with_goals(user, chapters[0].id, uuid4(), result)
+    with pytest.raises(ValueError, match="not found"):
+        service.complete_chapter_with_goals(user, "missing", uuid4(), result)
+
+
+def test_story_progress_loads_current_chapter_eagerly(db_session, story_tree, count_statements) -> None:
+    story, chapters, _ = story_tree
+    user = _user(db_session)
+    StoryService(db_session).start_story(user, story.id)
+    story_id, first_chapter_id = story.id, chapters[0].id
+
+    with Session(bind=db_session.get_bind()) as fresh:
+        with count_statements() as statements:
+            progress = StoryService(fresh).get_story_progress(user, story_id)
+            chapter = fresh.get(Chapter, progress.current_chapter_id)
+            loaded_story = fresh.get(Story, story_id)
+            titles = [item.title for item in loaded_story.chapters]
+
+        assert progress.current_chapter is chapter
+    assert chapter.id == first_chapter_id
+    assert titles == ["Chapitre 1", "Chapitre 2", "Chapitre 3"]
+    # progress + joined chapter, then the story and its lazily loaded chapters
+    assert len(statements) == 3
+
+
+def test_make_narrative_choice_follows_branch_to_first_scene(db_session, story_tree) -> None:
+    story, chapters, scenes = story_tree
+    user = _user(db_session)
+    chapters[0].branching_choices = [
+        {"choice_id": "follow", "next_chapter_id": chapters[2].id},
+        {"choice_id": "stay"},
+    ]
+    chapters[0].default_next_chapter_id = chapters[1].id
+    db_session.commit()
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+
+    with pytest.raises(ValueError, match="Invalid choice_id"):
+        service.make_narrative_choice(user, story.id, "unknown")
+
+    result = service.make_narrative_choice(user, story.id, "follow")
+
+    progress = service.get_story_progress(user, story.id)
+    assert result.next_chapter.id == chapters[2].id
+    assert progress.current_chapter_id == chapters[2].id
+    assert progress.current_scene_id == scenes[2].id
+    assert progress.narrative_choices == {chapters[0].id: "follow"}
+
+
+def test_make_narrative_choice_sees_edited_choices_despite_cached_graph(db_session, story_tree) -> None:
+    story, chapters, _ = story_tree
+    user = _user(db_session)
+    chapters[0].branching_choices = [{"choice_id": "stay"}]
+    chapters[0].default_next_chapter_id = chapters[1].id
+    db_session.commit()
+    StoryService(db_session).start_story(user, story.id)  # caches the chapter graph
+
+    chapters[0].branching_choices = [{"choice_id": "shortcut", "next_chapter_id": chapters[2].id}]
+    db_session.commit()
+    result = StoryService(db_session).make_narrative_choice(user, story.id, "shortcut")
+
+    assert result.next_chapter.id == chapters[2].id
+
+
+def test_start_story_sets_timestamps_without_refresh(db_session, story_tree) -> None:
+    story, chapters, scenes = story_tree
+    user = _user(db_session)
+
+    result = StoryService(db_session).start_story(user, story.id)
+
+    progress = result.progress
+    assert progress.started_at == progress.last_played_at
+    assert (progress.current_chapter_id, progress.current_scene_id) == (chapters[0].id, scenes[0].id)
+
+
+def test_get_current_scene_loads_scene_chapter_and_story_together(db_session, story_tree, count_statements) -> None:
+    story, chapters, scenes = story_tree
+    user = _user(db_session)
+    StoryService(db_session).start_story(user, story.id)
+    story_id = story.id
+
+    with Session(bind=db_session.get_bind()) as fresh:
+        with count_statements() as statements:
+            context = StoryService(fresh).get_current_scene(user, story_id)
+
+        assert (context.story.id, context.chapter.id, context.scene.id) == (story_id, chapters[0].id, scenes[0].id)
+    assert context.narration == "Scène 1"
+    # progress + joined chapter, then scene, chapter and story together
+    assert len(statements) == 2
+
+
+def test_scene_context_batches_npcs_and_creates_missing_relationships(db_session, story_tree) -> None:
+    story, _, scenes = story_tree
+    user = _user(db_session)
+    suffix = uuid4().hex[:8]
+    guide = NPC(id=f"guide_{suffix}", name="Guide", relationship_config={"initial_level": 3})
+    baker = NPC(id=f"baker_{suffix}", name="Boulanger")
+    db_session.add_all([guide, baker])
+    db_session.add(NPCRelationship(user_id=user.id, npc_id=baker.id, level=6, trust=2, mood="happy"))
+    scenes[0].npcs_present = [guide.id, "missing_npc", baker.id]
+    db_session.commit()
+    try:
+        result = StoryService(db_session).start_story(user, story.id)
+
+        contexts = [(npc.npc.id, npc.relationship_level, npc.mood) for npc in result.scene.npcs]
+        assert contexts == [(guide.id, 3, "neutral"), (baker.id, 6, "happy")]
+        assert db_session.query(NPCRelationship).filter(NPCRelationship.user_id == user.id).count() == 2
+    finally:
+        db_session.query(NPCRelationship).filter(NPCRelationship.user_id == user.id).delete()
+        db_session.query(NPC).filter(NPC.id.in_([guide.id, baker.id])).delete()
+        db_session.commit()
+
+
+def test_advance_scene_moves_and_commits_once(db_session, story_tree) -> None:
+    story, chapters, scenes = story_tree
+    user = _user(db_session)
+    second = Scene(
+        id=f"sc1b_{uuid4().hex[:8]}",
+        chapter_id=chapters[0].id,
+        order_index=2,
+        narration_variants={"A2": "Deuxième scène"},
+        npcs_present=[],
+    )
+    db_session.add(second)
+    scenes[0].transition_rules = [{"condition": {"trigger": "leave"}, "next_scene": second.id}]
+    db_session.commit()
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+
+    commits: list[Session] = []
+
+    def _record(session):  # type: ignore[no-untyped-def]
+        commits.append(session)
+
+    event.listen(db_session, "after_commit", _record)
+    try:
+        context = service.advance_scene(user, story.id, "leave")
+    finally:
+        event.remove(db_session, "after_commit", _record)
+
+    assert context.scene.id == second.id
+    assert context.narration == "Deuxième scène"
+    assert service.get_story_progress(user, story.id).current_scene_id == second.id
+    assert len(commits) == 1
+
+
+def test_advance_scene_moves_to_next_chapter_from_chapter_graph(db_session, story_tree) -> None:
+    story, chapters, scenes = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+
+    context = service.advance_scene(user, story.id, "continue")
+
+    progress = service.get_story_progress(user, story.id)
+    assert (context.chapter.id, context.scene.id) == (chapters[1].id, scenes[1].id)
+    assert (progress.current_chapter_id, progress.current_scene_id) == (chapters[1].id, scenes[1].id)
+    assert progress.chapters_completed == [chapters[0].id]
+    assert progress.completion_percentage == 33
+
+
+def test_progress_lists_keep_every_unique_entry(db_session, story_tree) -> None:
+    story, _, _ = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+
+    for learning in ("essentiel", "invisible", "essentiel"):
+        service.add_philosophical_learning(user, story.id, learning)
+    for quote_id in ("q1", "q2", "q1"):
+        service.unlock_book_quote(user, story.id, quote_id)
+
+    db_session.expire_all()
+    progress = service.get_story_progress(user, story.id)
+    assert progress.philosophical_learnings == ["essentiel", "invisible"]
+    assert progress.book_quotes_unlocked == ["q1", "q2"]
+
+
+def test_queue_scene_vocabulary_matches_normalized_and_exact_words(db_session, story_tree) -> None:
+    from app.services.progress import ProgressService
+
+    _, chapters, _ = story_tree
+    user = _user(db_session)
+    suffix = uuid4().hex[:8]
+    clue = VocabularyWord(language="fr", word=f"indice{suffix}", normalized_word=f"indice{suffix}")
+    cup = VocabularyWord(language="fr", word=f"Tasse{suffix}", normalized_word=f"tasse-{suffix}")
+    db_session.add_all([clue, cup])
+    db_session.commit()
+    chapter = chapters[0]
+    chapter.learning_focus = {"vocabulary": [clue.word.upper(), {"word": cup.word}, clue.word, "inconnu"]}
+
+    queued = StoryService(db_session).queue_scene_vocabulary(user, chapter, ProgressService(db_session))
+
+    assert [word.id for word in queued] == [clue.id, cup.id]
+
+
+def test_get_chapter_vocabulary_is_cached_per_word_list(db_session, story_tree) -> None:
+    _, chapters, _ = story_tree
+    suffix = uuid4().hex[:8]
+    word = VocabularyWord(language="fr", word=f"carnet{suffix}", normalized_word=f"carnet{suffix}", english_translation="notebook")
+    db_session.add(word)
+    db_session.commit()
+    chapter = chapters[0]
+    chapter.learning_focus = {"vocabulary": [word.word]}
+    service = StoryService(db_session)
+
+    assert service.get_chapter_vocabulary(chapter)[0]["translation"] == "notebook"
+    word.english_translation = "notepad"
+    db_session.commit()
+    assert service.get_chapter_vocabulary(chapter)[0]["translation"] == "notebook"
+
+    chapter.learning_focus = {"vocabulary": [word.word, "stylo"]}
+    assert [item["translation"] for item in service.get_chapter_vocabulary(chapter)] == ["notepad", None]
+
+
+def test_story_flags_and_choices_are_updated_in_place(db_session, story_tree) -> None:
+    story, _, scenes = story_tree
+    user = _user(db_session)
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+
+    service.set_story_flag(user, story.id, "met_baker")
+    service.set_story_flag(user, story.id, "clue_count", 2)
+    service.set_story_flag(user, story.id, "met_baker", False)
+    service.record_player_choice(user, story.id, scenes[0].id, "left")
+    service.record_player_choice(user, story.id, scenes[0].id, "right")
+
+    progress = service.get_story_progress(user, story.id)
+    assert progress.story_flags == {"met_baker": False, "clue_count": 2}
+    assert [choice["choice_id"] for choice in progress.player_choices] == ["left", "right"]
+
+
+def test_story_progress_lookup_is_reused_within_a_service(db_session, story_tree, count_statements) -> None:
+    story, _, _ = story_tree
+    user = _user(db_session)
+    StoryService(db_session).start_story(user, story.id)
+    service = StoryService(db_session)
+    story_id = story.id
+    db_session.refresh(user)
+
+    with count_statements() as statements:
+        first = service.get_story_progress(user, story_id)
+        second = service.get_story_progress(user, story_id)
+
+    assert first is second
+    assert len(statements) == 1
+
+
+def test_advance_scene_follows_scene_order_within_chapter(db_session, story_tree) -> None:
+    story, chapters, _ = story_tree
+    user = _user(db_session)
+    following = Scene(
+        id=f"sc1c_{uuid4().hex[:8]}",
+        chapter_id=chapters[0].id,
+        order_index=5,
+        narration_variants={"A1": "Plus tard"},
+        npcs_present=[],
+    )
+    db_session.add(following)
+    db_session.commit()
+    service = StoryService(db_session)
+    service.start_story(user, story.id)
+
+    context = service.advance_scene(user, story.id, "continue")
+
+    assert (context.chapter.id, context.scene.id) == (chapters[0].id, following.id)
+
+
+def test_json_array_append_casts_plain_json_columns_on_postgresql() -> None:
+    dialect = postgresql.dialect()
+    session = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=dialect))
+
+    expression = _json_array_append(session, StoryProgress.chapters_completed_details, {"chapter_id": "c1"})
+    statement = update(StoryProgress).values(chapters_completed_details=expression)
+    sql = str(statement.compile(dialect=dialect))
+
+    # Without the cast PostgreSQL rejects COALESCE(json, jsonb) on databases
+    # where the column is still json
+    assert "coalesce(CAST(story_progress.chapters_completed_details AS JSONB)" in sql
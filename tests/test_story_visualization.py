@@ -0,0 +1,115 @@
+"""Tests for story scene visualization."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.db.models.story import Chapter, Scene, SceneImage, Story
+from app.services.graphic_novel_image_storage import GraphicNovelImageStorage
+from app.services.story_visualization import StoryVisualizationService
+from app.utils.cache import cache_backend
+
+DALLE_URL = "https://oaidalleapi.example/expiring.png"
+STORED_URL = "/media/graphic-novel/story-scene.png"
+
+
+@pytest.fixture()
+def scene(db_session):
+    suffix = uuid4().hex[:8]
+    story = Story(id=f"story_{suffix}", title=f"Histoire {suffix}", target_levels=["A1"], themes=["mystery"])
+    chapter = Chapter(id=f"ch_{suffix}", story_id=story.id, order_index=1, title="Chapitre", narrative_goals=[])
+    scene = Scene(
+        id=f"sc_{suffix}",
+        chapter_id=chapter.id,
+        order_index=1,
+        location="Un café",
+        description="Une tasse renversée",
+        atmosphere="mysterious",
+        npcs_present=[],
+    )
+    db_session.add_all([story, chapter, scene])
+    db_session.commit()
+    try:
+        yield scene
+    finally:
+        db_session.query(SceneImage).filter(SceneImage.scene_id == scene.id).delete()
+        db_session.query(Scene).filter(Scene.id == scene.id).delete()
+        db_session.query(Chapter).filter(Chapter.id == chapter.id).delete()
+        db_session.query(Story).filter(Story.id == story.id).delete()
+        db_session.commit()
+
+
+def _stub_generation(monkeypatch, *, stored: bool, on_generate=None) -> list[str]:
+    calls: list[str] = []
+
+    async def _call_dalle(self, prompt, size="1024x1024"):  # type: ignore[no-untyped-def]
+        calls.append(prompt)
+        if on_generate is not None:
+            on_generate(prompt)
+        return DALLE_URL
+
+    async def _persist_payload(self, payload, **kwargs):  # type: ignore[no-untyped-def]
+        if not stored:
+            return payload
+        return {**payload, "url": STORED_URL, "storage": {"backend": "local"}}
+
+    monkeypatch.setattr(StoryVisualizationService, "_call_dalle", _call_dalle)
+    monkeypatch.setattr(GraphicNovelImageStorage, "persist_payload", _persist_payload)
+    return calls
+
+
+def test_stored_scene_image_is_served_after_cache_eviction(db_session, scene, monkeypatch) -> None:
+    calls = _stub_generation(monkeypatch, stored=True)
+    service = StoryVisualizationService(db_session)
+
+    generated = asyncio.run(service.generate_scene_image(scene))
+    cache_backend.clear()
+    again = asyncio.run(service.generate_scene_image(scene))
+
+    assert len(calls) == 1
+    assert generated.url == STORED_URL
+    assert again.url == STORED_URL
+    assert again.cached is True
+
+
+def test_unstored_scene_image_is_not_persisted(db_session, scene, monkeypatch) -> None:
+    calls = _stub_generation(monkeypatch, stored=False)
+    service = StoryVisualizationService(db_session)
+
+    generated = asyncio.run(service.generate_scene_image(scene))
+    cache_backend.clear()
+    asyncio.run(service.generate_scene_image(scene))
+
+    assert generated.url == DALLE_URL
+    assert len(calls) == 2
+    assert db_session.scalars(select(SceneImage).where(SceneImage.scene_id == scene.id)).first() is None
+
+
+def test_concurrently_stored_scene_image_keeps_the_first_row(db_session, scene, monkeypatch) -> None:
+    service = StoryVisualizationService(db_session)
+
+    def _store_elsewhere(prompt: str) -> None:
+        # Another worker finishes the same image between the lookup and our insert
+        db_session.execute(
+            insert(SceneImage).values(
+                cache_key=service._get_cache_key(prompt, "dramatic"),
+                scene_id=scene.id,
+                style="dramatic",
+                url="/media/graphic-novel/first.png",
+                prompt=prompt,
+                generated_at=datetime.now(timezone.utc),
+            )
+        )
+        db_session.commit()
+
+    _stub_generation(monkeypatch, stored=True, on_generate=_store_elsewhere)
+
+    generated = asyncio.run(service.generate_scene_image(scene, style_override="dramatic"))
+
+    assert generated.url == STORED_URL
+    rows = db_session.scalars(select(SceneImage).where(SceneImage.scene_id == scene.id)).all()
+    assert [row.url for row in rows] == ["/media/graphic-novel/first.png"]
@@ -1,16 +1,21 @@
 """Tests for the cross-mode unified SRS service."""
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
+from app.db.base import Base
 from app.db.models.error import UserError
 from app.db.models.grammar import GrammarConcept, UserGrammarProgress
 from app.db.models.progress import UserVocabularyProgress
 from app.db.models.user import User
 from app.db.models.vocabulary import VocabularyWord
+from app.services import unified_srs
 from app.services.unified_srs import InterleavingMode, ItemType, UnifiedSRSService
 
 
@@ -154,6 +159,105 @@ def test_unified_queue_surfaces_cross_mode_due_items_and_filters_noise(db_sessio
     assert error_item.metadata["linked_word_id"] == word.id
 
 
+def test_due_summary_counts_every_type_in_one_query(db_session, count_statements) -> None:
+    user = _user(db_session)
+    _seed_due_memory(db_session, user)
+    service = UnifiedSRSService(db_session)
+    service._target_language(user.id)
+
+    with count_statements() as statements:
+        summary = service.get_due_summary(user.id)
+
+    assert len(statements) == 1
+    assert summary.by_type["vocab"]["due"] == 1
+    assert summary.by_type["grammar"]["due"] == 1
+    assert summary.by_type["errors"]["due"] == 1
+    assert summary.by_type["conjugation"]["due"] == 0
+    assert summary.total_due == 3
+
+
+def test_due_summary_is_cached_until_an_item_is_completed(db_session, count_statements) -> None:
+    user = _user(db_session)
+    _, _, error = _seed_due_memory(db_session, user)
+    service = UnifiedSRSService(db_session)
+    assert service.get_due_summary(user.id).by_type["errors"]["due"] == 1
+
+    with count_statements() as statements:
+        cached = service.get_due_summary(user.id)
+
+    assert statements == []
+    assert cached.total_due == 3
+
+    service.complete_item(user_id=user.id, item_type=ItemType.ERROR, item_id=str(error.id), rating=3)
+
+    assert service.get_due_summary(user.id).by_type["errors"]["due"] == 0
+
+
+def test_unified_queue_fetches_in_worker_sessions_on_server_databases(tmp_path, monkeypatch) -> None:
+    # Worker sessions need their own connections, which the shared in-memory
+    # test database cannot hand out
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(unified_srs, "SERIAL_FETCH_DIALECTS", set())
+
+    fetch_threads: list[str] = []
+    fetch_grammar = UnifiedSRSService._fetch_due_grammar
+
+    def _record_thread(self, *args):  # type: ignore[no-untyped-def]
+        fetch_threads.append(threading.current_thread().name)
+        return fetch_grammar(self, *args)
+
+    monkeypatch.setattr(UnifiedSRSService, "_fetch_due_grammar", _record_thread)
+    try:
+        with Session(engine) as session:
+            user = _user(session)
+            _seed_due_memory(session, user)
+            user_id = user.id
+            session.commit()
+            queue = UnifiedSRSService(session).get_daily_practice_queue(user_id=user_id)
+
+            assert fetch_threads and fetch_threads[0].startswith("unified-srs")
+            assert sorted(item.item_type for item in queue.queue) == sorted(
+                [ItemType.ERROR, ItemType.GRAMMAR, ItemType.VOCAB]
+            )
+            assert all(item.metadata.get("route") for item in queue.queue)
+            assert queue.summary.total_due == 3
+
+            # Flushed but uncommitted writes keep the fetches on the caller's
+            # session, and its transaction is left open
+            fetch_threads.clear()
+            session.add(
+                UserError(
+                    user_id=user_id,
+                    error_category="grammar",
+                    task_error_type="agreement",
+                    display_label="Past participle agreement",
+                    review_mode="grammar",
+                    state="review",
+                    next_review_date=datetime.now(timezone.utc) - timedelta(hours=1),
+                )
+            )
+            session.flush()
+            queue = UnifiedSRSService(session).get_daily_practice_queue(user_id=user_id)
+
+            assert fetch_threads == [threading.current_thread().name]
+            assert session.in_transaction()
+            assert queue.summary.total_due == 4
+    finally:
+        engine.dispose()
+
+
+def test_unified_queue_summary_matches_due_counts(db_session) -> None:
+    user = _user(db_session)
+    _seed_due_memory(db_session, user)
+    service = UnifiedSRSService(db_session)
+
+    session = service.get_daily_practice_queue(user_id=user.id, time_budget_minutes=1)
+
+    assert session.summary == service.get_due_summary(user.id)
+    assert session.summary.total_due == 3
+
+
 def test_unified_queue_labels_mission_phrases(db_session) -> None:
     user = _user(db_session)
     now = datetime.now(timezone.utc)